@@ -0,0 +1,81 @@
+"""
+Headless benchmark of how long a GUI takes to start.
+
+Each sample runs in a fresh interpreter and reports, from before the first import, the time
+to import pygame_gui.components, to construct a GUIBase, to build a handful of widgets and
+to draw and display the first frame. Also reports the wall time of the whole process.
+Medians over the samples are printed as JSON.
+
+    python benchmarks/startup.py --samples 10 --output startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+CHILD = '''
+import json, time
+start = time.perf_counter()
+times = {}
+
+import pygame_gui.components as gui
+times['import_components_s'] = time.perf_counter() - start
+
+from pygame_gui.gui_base import GUIBase
+gui_inst = GUIBase(dimensions=(400, 300))
+times['gui_base_s'] = time.perf_counter() - start
+
+gui.Text(gui_inst.window, dimensions=(100, 40), coordinates=(10, 10), text_value='Title')
+gui.Button(gui_inst.window, dimensions=(100, 40), coordinates=(10, 60), text_value='OK')
+gui.TextBox(gui_inst.window, dimensions=(160, 40), coordinates=(10, 110))
+times['widgets_s'] = time.perf_counter() - start
+
+import pygame
+gui_inst.window.layout()
+gui_inst.window.draw_block()
+pygame.display.flip()
+times['first_frame_s'] = time.perf_counter() - start
+
+print(json.dumps(times))
+'''
+
+
+def sample() -> dict:
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', CHILD], env=env, capture_output=True, text=True, check=True).stdout
+    times = json.loads(output.splitlines()[-1])
+    times['process_s'] = time.perf_counter() - start
+    return times
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--samples', type=int, default=10)
+    parser.add_argument('--output', help='write the JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    samples = [sample() for _ in range(args.samples)]
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'samples': args.samples,
+        'median': {key: statistics.median(times[key] for times in samples) for key in samples[0]},
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Headless benchmark of how the GUI scales with the number of widgets.
+
+For each widget type and tree size it measures construction time and memory, frame
+times for Window.draw_block (full redraw, idle, single widget changed) and the latency
+of dispatching mouse events, then prints the results as JSON.
+
+    python benchmarks/widget_scaling.py --sizes 10 100 1000 --output results.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+# Keep stdout to the JSON results
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+import pygame_gui.components as gui
+
+WINDOW_DIMENSIONS = 1000, 1000
+WIDGET_DIMENSIONS = {
+    'Block': (20, 10),
+    'Text': (40, 20),
+    'Button': (40, 20),
+    'TextBox': (80, 20),
+    'Dropdown': (80, 20),
+}
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+MOUSE_EVENTS = 1000
+FRAMES = 20
+
+
+def build_tree(widget_type: str, n: int) -> tuple[gui.Window, list]:
+    """A window holding n widgets of one type, tiled across it and wrapping round when full."""
+    window = gui.Window(dimensions=WINDOW_DIMENSIONS)
+    widget_class = getattr(gui, widget_type)
+    width, height = WIDGET_DIMENSIONS[widget_type]
+    columns, rows = WINDOW_DIMENSIONS[0] // width, WINDOW_DIMENSIONS[1] // height
+
+    kwargs = {}
+    if widget_type in {'Text', 'Button'}:
+        kwargs['text_value'] = 'label'
+    elif widget_type == 'Dropdown':
+        kwargs['options_list'] = [f'option {i}' for i in range(20)]
+
+    widgets = []
+    for i in range(n):
+        coordinates = (i % columns) * width, (i // columns % rows) * height
+        widgets.append(widget_class(window, dimensions=(width, height), coordinates=coordinates, **kwargs))
+    return window, widgets
+
+
+def _mean_time(function, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+def bench_widget(widget_type: str, n: int) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    window, widgets = build_tree(widget_type, n)
+    construction = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    window.draw_block()
+    first_frame = time.perf_counter() - start
+
+    def full_frame():
+        window.invalidate()
+        window.draw_block()
+
+    def changed_frame():
+        widgets[rng.randrange(n)].colour = (rng.randrange(256), 0, 0)
+        window.draw_block()
+
+    rng = random.Random(0)
+    full = _mean_time(full_frame, FRAMES)
+    idle = _mean_time(window.draw_block, FRAMES)
+    changed = _mean_time(changed_frame, FRAMES)
+
+    positions = [(rng.randrange(WINDOW_DIMENSIONS[0]), rng.randrange(WINDOW_DIMENSIONS[1])) for _ in range(MOUSE_EVENTS)]
+    motions = [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)) for pos in positions]
+    clicks = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=pygame.BUTTON_RIGHT) for pos in positions]
+
+    start = time.perf_counter()
+    for event in motions:
+        window.mouse_event_handler(event)
+    motion = (time.perf_counter() - start) / MOUSE_EVENTS
+
+    start = time.perf_counter()
+    for event in clicks:
+        window.mouse_event_handler(event)
+    click = (time.perf_counter() - start) / MOUSE_EVENTS
+
+    return {
+        'widget': widget_type,
+        'n': n,
+        'construction_s': construction,
+        'construction_per_widget_s': construction / n,
+        'memory_bytes': memory,
+        'first_frame_s': first_frame,
+        'full_frame_s': full,
+        'idle_frame_s': idle,
+        'changed_frame_s': changed,
+        'mouse_motion_s': motion,
+        'mouse_click_s': click,
+    }
+
+
+def run(widget_types: list[str], sizes: list[int]) -> dict:
+    logging.disable(logging.CRITICAL)
+    pygame.init()
+    try:
+        results = []
+        for widget_type in widget_types:
+            for n in sizes:
+                results.append(bench_widget(widget_type, n))
+                print(f'{widget_type} n={n} done', file=sys.stderr)
+    finally:
+        pygame.quit()
+        logging.disable(logging.NOTSET)
+
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+            'platform': platform.platform(),
+            'video_driver': os.environ['SDL_VIDEODRIVER'],
+        },
+        'results': results,
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--widgets', nargs='+', default=list(WIDGET_DIMENSIONS), choices=list(WIDGET_DIMENSIONS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    parser.add_argument('--output', help='write the JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    report = run(args.widgets, args.sizes)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,32 @@
+import importlib
+
 from pygame_gui.components.constants import MouseEvents, Alignment
-from pygame_gui.components.window import Window
-from pygame_gui.components.base_block import Block
-from pygame_gui.components.text_block import Text
-from pygame_gui.components.button_block import Button
-from pygame_gui.components.textbox_block import TextBox
-from pygame_gui.components.slider_block import Slider
-from pygame_gui.components.dropdown_block import Dropdown
+
+# Widget modules are only imported once one of their classes is first used, so that
+# programs don't pay for (or need the dependencies of) widgets they never create
+_LAZY_CLASSES = {
+    'Window': 'window',
+    'Block': 'base_block',
+    'Text': 'text_block',
+    'Button': 'button_block',
+    'TextBox': 'textbox_block',
+    'Slider': 'slider_block',
+    'Dropdown': 'dropdown_block',
+    'ProfilerOverlay': 'profiler_overlay',
+    'ProgressBar': 'progress_bar',
+}
+
+__all__ = ['MouseEvents', 'Alignment', *_LAZY_CLASSES]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f'{__name__}.{_LAZY_CLASSES[name]}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -1,11 +1,20 @@
-from typing import Self
+from typing import Any, Callable, Coroutine, Iterable, Self
+import asyncio
 
 import pygame
-from pygame_gui.components.constants import Alignment
-from pygame_gui.components.window import Window
+from pygame_gui.components.constants import Alignment, MouseEvents
+from pygame_gui.components.executor import BackgroundTask
+from pygame_gui.components.surface_pool import SurfacePool
+from pygame_gui.components.window import Timer, Window
 
 
 class Block(Window):
+    # Whether tab can move keyboard focus to this block
+    focusable = False
+
+    # Shared by every block, surfaces of deleted blocks are reused by new ones of the same size
+    surface_pool = SurfacePool()
+
     alignment_mapping = {
         'left': Alignment.LEFT,
         'centre': Alignment.CENTRE,
@@ -42,6 +51,11 @@ class Block(Window):
         be a single value which defines both x and y or a tuple for both.
         All three can input x and y separately with the x/y specific arguments, which should be
         individual values for that axis.
+        An axis aligned to both edges (Alignment.LEFT | Alignment.RIGHT or Alignment.TOP |
+        Alignment.BOTTOM) is anchored to them, the block stretching to fill its parent less the
+        margin at each end. Alignments and anchors are reapplied whenever the parent is resized.
+        In a parent which stacks its children, the position along the stacking axis is set by the
+        parent and shouldn't be given.
 
         Args:
             parent:
@@ -64,16 +78,23 @@ class Block(Window):
         """
         super().__init__(**kwargs)
 
-        # The various inputs which constrain the position
-        coordinates, alignments, margins = self.simplify_positional_requirements(
+        self.parent = parent
+        self.depth = parent.depth + 1
+        # Blocks never change window, so the root is looked up once
+        self._root = parent.root
+        self._absolute = None
+        self._absolute_version = None
+
+        # The various inputs which constrain the position, kept to lay the block out again
+        # when its parent is resized
+        self._constraints = self.simplify_positional_requirements(
             coordinates, coord_x, coord_y,
             alignment, align_x, align_y,
             margin, margin_x, margin_y)
 
-        # The true position as a result of the above constraints
-        self.coordinates = self.translate_positional_requirements(coordinates, alignments, margins)
+        # The true position and size as a result of the above constraints
+        self._coordinates, self.dimensions = self._layout_geometry()
 
-        self.parent = parent
         self.priority = priority
         self.polygon = polygon
 
@@ -88,7 +109,9 @@ class Block(Window):
         align_x, align_y = alignments
         margin_x, margin_y = margins
         if isinstance(align_x, Alignment):
-            if align_x == Alignment.LEFT:
+            if align_x == Alignment.LEFT | Alignment.RIGHT:
+                coord_x = margin_x
+            elif align_x == Alignment.LEFT:
                 coord_x = margin_x
             elif align_x == Alignment.CENTRE:
                 coord_x = (self.parent.dimensions[0] - self.dimensions[0]) // 2
@@ -96,7 +119,9 @@ class Block(Window):
                 coord_x = self.parent.dimensions[0] - self.dimensions[0] - margin_x
 
         if isinstance(align_y, Alignment):
-            if align_y == Alignment.TOP:
+            if align_y == Alignment.TOP | Alignment.BOTTOM:
+                coord_y = margin_y
+            elif align_y == Alignment.TOP:
                 coord_y = margin_y
             elif align_y == Alignment.CENTRE:
                 coord_y = (self.parent.dimensions[1] - self.dimensions[1]) // 2
@@ -115,8 +140,8 @@ class Block(Window):
             combined_value = combined_value, combined_value
 
         # For each parameter type and each axis, extract whichever value was provided
-        x_value = x_value or combined_value[0]
-        y_value = y_value or combined_value[1]
+        x_value = x_value if x_value is not None else combined_value[0]
+        y_value = y_value if y_value is not None else combined_value[1]
 
         return x_value, y_value
 
@@ -130,17 +155,18 @@ class Block(Window):
         align_x, align_y = self._simplify_single_positional_requirement('alignment', alignments, align_x, align_y)
         margin_x, margin_y = self._simplify_single_positional_requirement('margin', margins, margin_x, margin_y)
 
-        # Check that the axes have been correctly constrained
-        if coord_x and align_x:
+        # Check that the axes have been correctly constrained, the parent positions stacked blocks
+        stack_axis = self.parent._stack_axis
+        if coord_x is not None and align_x is not None:
             raise ValueError("The x position has been over-constrained")
-        if coord_x is None and align_x is None:
+        if coord_x is None and align_x is None and stack_axis != 0:
             raise ValueError("The x position has been under-constrained")
-        if coord_y and align_y:
+        if coord_y is not None and align_y is not None:
             raise ValueError("The y position has been over-constrained")
-        if coord_y is None and align_y is None:
+        if coord_y is None and align_y is None and stack_axis != 1:
             raise ValueError("The y position has been under-constrained")
 
-        if coord_x and margin_x or coord_y and margin_y:
+        if coord_x is not None and margin_x or coord_y is not None and margin_y:
             raise ValueError("Coordinates and margins should not be used together")
 
         coordinates = coord_x, coord_y
@@ -149,35 +175,271 @@ class Block(Window):
 
         return coordinates, alignments, margins
 
-    def _create_surface(self):
-        self.surface = pygame.Surface(self.dimensions).convert()
+    # Per axis, the alignment which anchors a block to both edges of its parent
+    anchors = Alignment.LEFT | Alignment.RIGHT, Alignment.TOP | Alignment.BOTTOM
+    # Alignments which position a block using its own size
+    self_sized_alignments = {Alignment.RIGHT, Alignment.CENTRE, Alignment.BOTTOM}
+
+    def _layout_geometry(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Coordinates and dimensions from the positional requirements and the parent's size."""
+        coordinates, alignments, margins = self._constraints
+
+        dimensions = list(self.dimensions)
+        for axis in 0, 1:
+            if alignments[axis] == self.anchors[axis]:
+                dimensions[axis] = max(0, self.parent.dimensions[axis] - 2 * margins[axis])
+
+        return self.translate_positional_requirements(coordinates, alignments, margins), tuple(dimensions)
+
+    def _depends_on_parent_size(self) -> bool:
+        return any(alignment not in {None, Alignment.LEFT, Alignment.TOP} for alignment in self._constraints[1])
+
+    def _init_root_state(self):
+        pass
+
+    @property
+    def root(self) -> Window:
+        return self._root
+
+    @property
+    def coordinates(self) -> tuple[int, int]:
+        """Position of this block on its parent's surface."""
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates: tuple[int, int]):
+        self._coordinates = tuple(coordinates)
+        self._root.transform_changed(self)
+
+    @property
+    def visible_rect(self) -> pygame.Rect:
+        """The part of this block inside all its ancestors, in window coordinates."""
+        return pygame.Rect(self.absolute_coordinates(), self.dimensions).clip(self.parent.visible_rect)
+
+    def absolute_coordinates(self) -> tuple[int, int]:
+        # Cached until any block in the window moves
+        version = self._root._transform_version
+        if self._absolute_version != version:
+            parent_x, parent_y = self.parent.absolute_coordinates()
+            self._absolute = parent_x + self._coordinates[0], parent_y + self._coordinates[1]
+            self._absolute_version = version
+        return self._absolute
+
+    def z_key(self) -> tuple:
+        return self.parent.z_key() + self._child_key
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: int):
+        self._priority = priority
+        self.parent.children.reorder(self)
+        self.invalidate()
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """The area covered by this block on its parent's surface."""
+        return pygame.Rect(self.coordinates, self.dimensions)
 
-    def draw_block(self):
-        super().draw_block()
+    def _create_surface(self):
+        self.surface = self.surface_pool.acquire(self.dimensions)
+
+    def _release_surface(self):
+        if self.surface is not None:
+            self.surface_pool.release(self.surface)
+            self.surface = None
+
+    def resize(self, dimensions: tuple[int, int]):
+        dimensions = tuple(dimensions)
+        if dimensions == self.dimensions:
+            return
+
+        self.parent.invalidate(self.rect)
+        self.dimensions = dimensions
+        if self.surface is not None:
+            self._release_surface()
+            self._create_surface()
+            self.invalidate()
+
+        root = self.root
+        # The hit rects of this block and its descendants may be clipped differently
+        root.transform_changed(self)
+        if self._layout_dependents or self.stack is not None:
+            root.request_layout(self)
+        if self.parent.stack is not None:
+            root.request_layout(self.parent)
+
+        # Blocks aligned right, centre or bottom are placed by their own size
+        coordinates = list(self.coordinates)
+        placed = self.translate_positional_requirements(*self._constraints)
+        for axis in 0, 1:
+            if self._constraints[1][axis] in self.self_sized_alignments:
+                coordinates[axis] = placed[axis]
+        if tuple(coordinates) != self.coordinates:
+            self.move(x=coordinates[0], y=coordinates[1])
+
+    def invalidate(self, rect: pygame.Rect | None = None):
+        if self.surface is None:
+            return
+
+        if rect is None:
+            rect = self.surface.get_rect()
+        super().invalidate(rect)
+
+        # The parent has to recomposite wherever this block changed
+        self.parent.invalidate(rect.move(self.coordinates))
+
+    def _render(self, area: pygame.Rect):
+        super()._render(area)
 
         self.blit_text()
         if self.polygon:
             pygame.draw.polygon(self.surface, *self.polygon)
 
+    def draw_block(self):
+        damage = super().draw_block()
+
         self.parent.surface.blit(self.surface, self.coordinates)
 
+        return damage
+
     def __delitem__(self):
         for child in self.children.copy():
             child.__delitem__()
 
-        self.parent.children.remove(self)
+        self.stop_updates(self)
+        self._remove_hit_rect()
+        self.root._stale_hit_rects.discard(self)
+        self.root.cancel_layout(self)
+        self.root.focus.clear_focus(self)
+        self.root.executor.cancel_owned(self)
+        self.parent.remove_child(self)
+        self._release_surface()
+        self.deleted = True
 
         self = None
 
+    def start_updates(self, block: Self):
+        self.parent.start_updates(block)
+
+    def stop_updates(self, block: Self):
+        self.parent.stop_updates(block)
+
+    def update(self):
+        pass
+
+    def keyboard_event_handler(self, event) -> bool:
+        """Handle a keyboard event sent to this block while it or a descendant has focus.
+
+        Returns True if the event was handled, otherwise it is passed on to the parent.
+        """
+        return False
+
+    def focus_gained(self):
+        pass
+
+    def focus_lost(self):
+        pass
+
+    def mouse_event_handler(self, event):
+        # Plain blocks don't respond to the mouse, the window sends events straight to the blocks that do
+        pass
+
+    def _update_hit_rects(self):
+        for child in self.children:
+            child._update_hit_rects()
+
+    def _remove_hit_rect(self):
+        pass
+
+    def set_timer(self, callback: Callable[[], None], interval: int, *, repeat: bool = True) -> Timer:
+        return self.parent.set_timer(callback, interval, repeat=repeat)
+
+    def run_coroutine(self, coroutine: Coroutine, on_done: Callable[[Any], None] | None = None) -> asyncio.Task:
+        return self.parent.run_coroutine(coroutine, on_done)
+
+    def submit(self, function: Callable, *args, **kwargs) -> BackgroundTask:
+        """Run function off the GUI thread, cancelling it if this block is deleted first."""
+        kwargs.setdefault('owner', self)
+        return self.parent.submit(function, *args, **kwargs)
+
+    # The services below belong to the whole tree, their state lives on the root window
+
+    def transform_changed(self, block: Self):
+        self.root.transform_changed(block)
+
+    def hit_rects_changed(self, block: Self):
+        self.root.hit_rects_changed(block)
+
+    def refresh_hit_rects(self):
+        self.root.refresh_hit_rects()
+
+    def request_layout(self, block: Self):
+        self.root.request_layout(block)
+
+    def cancel_layout(self, block: Self):
+        self.root.cancel_layout(block)
+
+    def layout(self):
+        self.root.layout()
+
+    def capture_mouse(self, block: Self):
+        self.root.capture_mouse(block)
+
+    def release_mouse(self, block: Self):
+        self.root.release_mouse(block)
+
+    def add_mouse_listener(self, block: Self):
+        self.root.add_mouse_listener(block)
+
+    def remove_mouse_listener(self, block: Self):
+        self.root.remove_mouse_listener(block)
+
+    def add_mouse_events(self, mouse_events: Iterable[MouseEvents]):
+        self.root.add_mouse_events(mouse_events)
+
+    def remove_mouse_events(self, mouse_events: Iterable[MouseEvents]):
+        self.root.remove_mouse_events(mouse_events)
+
+    def consumed_mouse_event_types(self) -> set[int]:
+        return self.root.consumed_mouse_event_types()
+
+    def is_idle(self) -> bool:
+        return self.root.is_idle()
+
+    def time_until_next_timer(self) -> int | None:
+        return self.root.time_until_next_timer()
+
+    def run_timers(self):
+        self.root.run_timers()
+
+    def handle_result(self, result):
+        self.root.handle_result(result)
+
+    async def cancel_coroutines(self):
+        await self.root.cancel_coroutines()
+
     def move(self,
              del_x: int = 0,
              del_y: int = 0,
 
              x: int = None,
              y: int = None):
+        if x is None:
+            x = self.coordinates[0] + del_x
+        if y is None:
+            y = self.coordinates[1] + del_y
+
+        # Both the vacated and the newly covered areas need redrawing
+        self.parent.invalidate(self.rect)
+
         # Update coordinates
         self.coordinates = x, y
 
+        self.parent.invalidate(self.rect)
+
 
 if __name__ == '__main__':
     pass
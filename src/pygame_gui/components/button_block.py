@@ -1,7 +1,7 @@
 import pygame
 from pygame import K_RETURN
 
-from pygame_gui.components.constants import MouseEvents
+from pygame_gui.components.constants import MOUSE_EVENT_LOOKUP, MouseEvents
 from pygame_gui.components.text_block import Text
 
 
@@ -11,57 +11,59 @@ class Button(Text):
         super().__init__(parent, **kwargs)
 
         self.held = False
-        self.event_function_dict = {
-            MouseEvents.LEFT_MOUSE_UP: lambda *_: None,
-            MouseEvents.MIDDLE_MOUSE_UP: lambda *_: None,
-            MouseEvents.RIGHT_MOUSE_UP: lambda *_: None,
-            MouseEvents.SCROLL_MOUSE_UP: lambda *_: None,
-
-            MouseEvents.LEFT_MOUSE_DOWN: lambda *_: None,
-            MouseEvents.MIDDLE_MOUSE_DOWN: lambda *_: None,
-            MouseEvents.RIGHT_MOUSE_DOWN: lambda *_: None,
-            MouseEvents.SCROLL_MOUSE_DOWN: lambda *_: None,
-
-            MouseEvents.MOVE_MOUSE: lambda *_: None,
-        }
+        # Only holds the mouse events this button responds to
+        self.event_function_dict = {}
 
         def _hold_down(event):
             if self.check_collision(event):
                 self.log.debug(f'Holding {self}')
                 self.held = True
+                self.root.capture_mouse(self)
 
         def _release(event):
             if self.held:
                 self.log.debug(f'Releasing {self}')
                 self.held = False
+                self.root.release_mouse(self)
 
         self.default_mouse_handlers = {MouseEvents.LEFT_MOUSE_DOWN: _hold_down,
                                        MouseEvents.LEFT_MOUSE_UP: _release}
-        self.set_mouse_handlers(self.event_function_dict)
-
-    def _create_surface(self):
-        super()._create_surface()
-
-        # Coordinates need to be reference from window, not parent surface
-        this_parent = self.parent
-        self.overall_coords = list(self.coordinates)
-        while hasattr(this_parent, 'parent'):
-            self.overall_coords[0] += this_parent.parent.coordinates[0]
-            self.overall_coords[1] += this_parent.parent.coordinates[1]
-            this_parent = this_parent.parent
+        self.event_function_dict.update(self.default_mouse_handlers)
+        self.root.add_mouse_events(self.event_function_dict.keys())
 
-        self.create_rect()
+        # Indexed before the next mouse event, so building many buttons at once indexes them once
+        self.root.hit_rects_changed(self)
 
     def create_rect(self):
         # Create rect object for simplicity of collision detection
         self.button_rect = pygame.Rect(self.overall_coords, self.dimensions)
 
+        # Only the part of the button that is actually visible can be clicked
+        self.root.hit_index.insert(self, self.button_rect.clip(self.parent.visible_rect))
+
+    def _update_hit_rects(self):
+        # Coordinates need to be reference from window, not parent surface
+        self.overall_coords = list(self.absolute_coordinates())
+        self.create_rect()
+
+        super()._update_hit_rects()
+
+    def _remove_hit_rect(self):
+        root = self.root
+        root.hit_index.remove(self)
+        root.release_mouse(self)
+        root.remove_mouse_listener(self)
+        root.remove_mouse_events(self.event_function_dict.keys())
+
     def set_mouse_handlers(self, function_dict):
+        self.root.add_mouse_events(func_name for func_name in function_dict if func_name not in self.event_function_dict)
+
         for func_name, func in function_dict.items():
             def modify_default(default_func, new_func):
                 def inner(*arg):
-                    new_func(*arg)
+                    result = new_func(*arg)
                     default_func(*arg)
+                    return result
 
                 return inner
 
@@ -77,41 +79,14 @@ class Button(Text):
         return scroll
 
     def mouse_event_handler(self, event):
-        super().mouse_event_handler(event)
-
-        event_id = [event.type]
-        if hasattr(event, 'button'):
-            event_id.append(event.button)
-
-        try:
-            mouse_event = MouseEvents(tuple(event_id))
-        except ValueError:
-            self.log.error(f'Unknown MouseEvent: {tuple(event_id)}')
-        else:
-            f = self.event_function_dict.get(mouse_event, None)
-            if f:
-                f(event)
+        # Unknown events (e.g. extra mouse buttons) and events without a handler are ignored
+        f = self.event_function_dict.get(MOUSE_EVENT_LOOKUP.get((event.type, getattr(event, 'button', None))))
+        if f is not None:
+            # Handlers may be coroutine functions, which run as tasks
+            self.root.handle_result(f(event))
 
     def check_collision(self, event):
         collided = self.button_rect.collidepoint(event.pos)
         if collided:
             self.log.debug(f"Collision detected with {self}")
         return collided
-
-    def move(self, del_x=0, del_y=0, x=None, y=None):
-        if x is None:
-            x = self.coordinates[0] + del_x
-        else:
-            del_x = x - self.coordinates[0]
-        if y is None:
-            y = self.coordinates[1] + del_y
-        else:
-            del_y = y - self.coordinates[1]
-
-        super().move(del_x, del_y, x, y)
-
-        # Update rect
-        self.overall_coords[0] += del_x
-        self.overall_coords[1] += del_y
-
-        self.create_rect()
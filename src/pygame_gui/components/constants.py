@@ -71,6 +71,13 @@ class MouseEvents(Enum):
     MOVE_MOUSE = (MOUSEMOTION,)
 
 
+# (event type, mouse button) -> MouseEvents, with a button of None for mouse motion
+MOUSE_EVENT_LOOKUP = {
+    (mouse_event.value[0], mouse_event.value[1] if len(mouse_event.value) > 1 else None): mouse_event
+    for mouse_event in MouseEvents
+}
+
+
 class Alignment(IntFlag):
     # x alignments
     LEFT = auto()
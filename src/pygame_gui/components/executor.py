@@ -0,0 +1,250 @@
+from concurrent.futures import Future
+from typing import Any, Callable
+import inspect
+import itertools
+import logging
+import threading
+
+from pygame_gui.components.update_queue import UpdateQueue
+
+
+class TaskCancelled(Exception):
+    """Raised by a thread task's progress reporter once the task has been cancelled."""
+
+
+class _ThreadProgress:
+    def __init__(self, task: 'BackgroundTask'):
+        self.task = task
+
+    def __call__(self, fraction: float):
+        # Reporting progress is where long running work finds out it should stop
+        if self.task.cancelled:
+            raise TaskCancelled
+        self.task._report(fraction)
+
+
+class _ProcessProgress:
+    """Sent to the worker process, so only holds what can be pickled."""
+
+    def __init__(self, task_id: int, queue):
+        self.task_id = task_id
+        self.queue = queue
+
+    def __call__(self, fraction: float):
+        self.queue.put((self.task_id, fraction))
+
+
+class BackgroundTask:
+    """Work submitted to a BackgroundExecutor.
+
+    Its callbacks are called on the GUI thread between frames: progress callbacks with the
+    latest fraction reported, done callbacks with the result and error callbacks with the
+    exception raised. None are called once the task has been cancelled.
+    """
+
+    def __init__(self, updates: UpdateQueue, owner):
+        self.owner = owner
+        self.future = None
+
+        self.progress = 0.0
+        self.done = False
+        self.cancelled = False
+        self.result = None
+        self.exception = None
+
+        self._updates = updates
+        # Set by the executor to stop tracking the task once it finishes or is cancelled
+        self._on_settled = None
+        self._progress_callbacks = []
+        self._done_callbacks = []
+        self._error_callbacks = []
+
+    def add_progress_callback(self, callback: Callable[[float], None]):
+        self._progress_callbacks.append(callback)
+
+    def add_done_callback(self, callback: Callable[[Any], None]):
+        self._done_callbacks.append(callback)
+
+    def add_error_callback(self, callback: Callable[[BaseException], None]):
+        self._error_callbacks.append(callback)
+
+    def cancel(self):
+        """Stop the task if it hasn't started, otherwise stop delivering its callbacks.
+
+        Running thread tasks are also stopped the next time they report progress.
+        """
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+        self._settle()
+
+    def _settle(self):
+        if self._on_settled is not None:
+            self._on_settled(self)
+            self._on_settled = None
+
+    def _report(self, fraction: float):
+        # Called from the worker, only the latest progress of a frame is delivered
+        self._updates.post((self, 'progress'), self._progress_changed, fraction)
+
+    def _progress_changed(self, fraction: float):
+        if self.cancelled or self.done:
+            return
+        self.progress = fraction
+        for callback in self._progress_callbacks:
+            callback(fraction)
+
+    def _future_done(self, future: Future):
+        self._updates.post((self, 'done'), self._finish, future)
+
+    def _finish(self, future: Future):
+        self._settle()
+        if self.cancelled or future.cancelled():
+            return
+
+        self.exception = future.exception()
+        if self.exception is not None:
+            self.done = True
+            if not self._error_callbacks:
+                logging.getLogger('pygame_gui').error('Background task failed', exc_info=self.exception)
+            for callback in self._error_callbacks:
+                callback(self.exception)
+            return
+
+        self.result = future.result()
+        # Before done is set, as later progress is ignored. Progress from processes may
+        # arrive after the result, so this is the only report of completion they're sure of.
+        self._progress_changed(1.0)
+        self.done = True
+        for callback in self._done_callbacks:
+            callback(self.result)
+
+
+class BackgroundExecutor:
+    """Runs work in a thread or process pool, delivering its callbacks on the GUI thread.
+
+    Callbacks come back through the window's update queue, so they run once a frame with the
+    other queued updates. Work taking a `progress` argument is passed a callable to report
+    the fraction done with. The pools are only started when first used.
+    """
+
+    def __init__(self, updates: UpdateQueue, *, max_workers: int | None = None):
+        self.updates = updates
+        self.max_workers = max_workers
+
+        self._threads = None
+        self._processes = None
+        self._manager = None
+        self._progress_queue = None
+        self._process_tasks = {}
+        self._task_count = itertools.count()
+        self._owned = {}
+
+    def submit(self, function: Callable, *args,
+               owner=None,
+               process: bool = False,
+               on_done: Callable[[Any], None] | None = None,
+               on_progress: Callable[[float], None] | None = None,
+               on_error: Callable[[BaseException], None] | None = None,
+               **kwargs) -> BackgroundTask:
+        """Run function(*args, **kwargs) in a worker thread, or a worker process if process.
+
+        The task is cancelled when owner is deleted. Functions run in a process, and their
+        arguments, have to be picklable.
+        """
+        task = BackgroundTask(self.updates, owner)
+        if on_done is not None:
+            task.add_done_callback(on_done)
+        if on_progress is not None:
+            task.add_progress_callback(on_progress)
+        if on_error is not None:
+            task.add_error_callback(on_error)
+
+        try:
+            takes_progress = 'progress' in inspect.signature(function).parameters
+        except (ValueError, TypeError):
+            # Builtins without a signature can't be asking for progress
+            takes_progress = False
+
+        task_id = None
+        if process:
+            task_id = next(self._task_count)
+            pool = self._process_pool()
+            if takes_progress:
+                kwargs['progress'] = _ProcessProgress(task_id, self._progress_queue)
+            self._process_tasks[task_id] = task
+        else:
+            pool = self._thread_pool()
+            if takes_progress:
+                kwargs['progress'] = _ThreadProgress(task)
+
+        if owner is not None:
+            self._owned.setdefault(owner, set()).add(task)
+        task._on_settled = lambda task: self._forget(task, task_id)
+
+        task.future = pool.submit(function, *args, **kwargs)
+        task.future.add_done_callback(task._future_done)
+        return task
+
+    def _thread_pool(self):
+        if self._threads is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._threads = ThreadPoolExecutor(self.max_workers, thread_name_prefix='pygame_gui')
+        return self._threads
+
+    def _process_pool(self):
+        if self._processes is None:
+            # Imported here so that programs only using threads don't pay for it at startup
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+
+            # Progress from other processes comes back through a managed queue, forwarded
+            # to the update queue by a thread of this process
+            self._manager = multiprocessing.Manager()
+            self._progress_queue = self._manager.Queue()
+            threading.Thread(target=self._forward_progress, args=(self._progress_queue,), daemon=True).start()
+            self._processes = ProcessPoolExecutor(self.max_workers)
+        return self._processes
+
+    def _forward_progress(self, queue):
+        while True:
+            try:
+                item = queue.get()
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+
+            task_id, fraction = item
+            task = self._process_tasks.get(task_id)
+            if task is not None:
+                task._report(fraction)
+
+    def _forget(self, task: BackgroundTask, task_id: int | None):
+        owned = self._owned.get(task.owner)
+        if owned is not None:
+            owned.discard(task)
+            if not owned:
+                del self._owned[task.owner]
+        if task_id is not None:
+            self._process_tasks.pop(task_id, None)
+
+    def cancel_owned(self, owner):
+        """Cancel every task submitted with owner."""
+        for task in self._owned.pop(owner, ()):
+            task.cancel()
+
+    def shutdown(self):
+        """Cancel everything and stop the pools without waiting for running work."""
+        for owner in list(self._owned):
+            self.cancel_owned(owner)
+
+        if self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._progress_queue.put(None)
+            self._manager.shutdown()
+            self._processes = self._manager = self._progress_queue = None
+            self._process_tasks.clear()
@@ -0,0 +1,68 @@
+import pygame
+
+
+class FocusManager:
+    """Tracks which block of a window receives keyboard events.
+
+    Keyboard events go to the focused block and, if it doesn't handle them, bubble up
+    through its ancestors. Tab and shift-tab move focus through the focusable blocks in
+    drawing order.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.focused = None
+
+    def set_focus(self, block):
+        if block is self.focused:
+            return
+
+        previous, self.focused = self.focused, block
+        if previous is not None:
+            previous.focus_lost()
+        if block is not None:
+            block.focus_gained()
+
+    def clear_focus(self, block=None):
+        """Remove focus, or only remove it from block if given."""
+        if block is None or block is self.focused:
+            self.set_focus(None)
+
+    def focus_order(self) -> list:
+        order = []
+        stack = list(reversed(self.window.children))
+        while stack:
+            block = stack.pop()
+            if block.focusable:
+                order.append(block)
+            stack.extend(reversed(block.children))
+        return order
+
+    def focus_next(self, reverse: bool = False):
+        order = self.focus_order()
+        if not order:
+            return
+
+        if self.focused in order:
+            i = order.index(self.focused) + (-1 if reverse else 1)
+        else:
+            i = -1 if reverse else 0
+        self.set_focus(order[i % len(order)])
+
+    def dispatch(self, event) -> bool:
+        """Send a keyboard event to the focused block, then its ancestors. True if handled."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+            self.focus_next(reverse=bool(event.mod & pygame.KMOD_SHIFT))
+            return True
+
+        profiler = self.window.profiler
+        block = self.focused
+        while block is not None and block is not self.window:
+            if profiler.enabled:
+                handled = profiler.call(block, 'keyboard', block.keyboard_event_handler, event)
+            else:
+                handled = block.keyboard_event_handler(event)
+            if handled:
+                return True
+            block = block.parent
+        return False
@@ -0,0 +1,55 @@
+import pygame
+
+
+class FontRegistry:
+    """Pool of fonts keyed by (font file, size, style) so that blocks can share them.
+
+    Fonts handed out are shared and must not have their style changed, request a
+    different style from the registry instead. Fonts do not survive pygame.quit(), so the
+    pool empties itself when pygame is shut down.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        self._clear_on_quit = False
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def get(self, font_file: str | None = None, size: int = 20, *,
+            bold: bool = False,
+            italic: bool = False,
+            underline: bool = False) -> pygame.font.Font:
+        key = font_file, size, (bold, italic, underline)
+        font = self._fonts.get(key)
+        if font is not None and pygame.font.get_init():
+            self.hits += 1
+            return font
+
+        if not pygame.font.get_init():
+            self.clear()
+            pygame.font.init()
+        if not self._clear_on_quit:
+            pygame.register_quit(self.clear)
+            self._clear_on_quit = True
+
+        self.misses += 1
+        font = pygame.font.Font(font_file, size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        font.set_underline(underline)
+
+        self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+        self._clear_on_quit = False
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {'fonts': len(self._fonts), 'hits': self.hits, 'misses': self.misses}
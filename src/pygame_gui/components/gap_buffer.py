@@ -0,0 +1,83 @@
+class GapBuffer:
+    """Editable text stored as a list of characters with a gap at the last edit.
+
+    Inserting or deleting at the gap is O(1) amortized, and moving the gap costs only the
+    distance moved, so typing at a cursor stays cheap however long the text is. The range
+    of characters changed since the last call to take_dirty() is tracked so that anything
+    derived from the text (rendering, character widths) only has to be updated from there.
+    """
+
+    def __init__(self, text: str = '', gap_size: int = 16):
+        self.gap_size = gap_size
+        self._dirty_start = None
+        self.set_text(text)
+
+    def __len__(self) -> int:
+        return len(self._buffer) - (self._gap_end - self._gap_start)
+
+    def __str__(self) -> str:
+        return ''.join(self._buffer[:self._gap_start]) + ''.join(self._buffer[self._gap_end:])
+
+    def __getitem__(self, i: int) -> str:
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._buffer[i] if i < self._gap_start else self._buffer[i + self._gap_end - self._gap_start]
+
+    def _move_gap(self, pos: int):
+        if pos < self._gap_start:
+            moved = self._gap_start - pos
+            self._buffer[self._gap_end - moved:self._gap_end] = self._buffer[pos:self._gap_start]
+            self._gap_start -= moved
+            self._gap_end -= moved
+        elif pos > self._gap_start:
+            moved = pos - self._gap_start
+            self._buffer[self._gap_start:pos] = self._buffer[self._gap_end:self._gap_end + moved]
+            self._gap_start += moved
+            self._gap_end += moved
+
+    def _mark_dirty(self, pos: int):
+        if self._dirty_start is None or pos < self._dirty_start:
+            self._dirty_start = pos
+
+    def insert(self, pos: int, text: str):
+        if not 0 <= pos <= len(self):
+            raise IndexError(pos)
+
+        self._move_gap(pos)
+        if self._gap_end - self._gap_start < len(text):
+            # Double the buffer so that growing is amortized over many inserts
+            extra = max(len(text), len(self._buffer))
+            self._buffer[self._gap_start:self._gap_start] = [''] * extra
+            self._gap_end += extra
+
+        self._buffer[self._gap_start:self._gap_start + len(text)] = text
+        self._gap_start += len(text)
+        self._mark_dirty(pos)
+
+    def delete(self, pos: int, length: int = 1):
+        """Remove up to length characters starting at pos."""
+        if not 0 <= pos <= len(self):
+            raise IndexError(pos)
+
+        length = min(length, len(self) - pos)
+        if length <= 0:
+            return
+
+        self._move_gap(pos)
+        self._gap_end += length
+        self._mark_dirty(pos)
+
+    def set_text(self, text: str):
+        self._buffer = list(text) + [''] * self.gap_size
+        self._gap_start = len(text)
+        self._gap_end = len(self._buffer)
+        self._mark_dirty(0)
+
+    def take_dirty(self) -> tuple[int, int] | None:
+        """The (start, end) range of characters changed since the last call, or None."""
+        if self._dirty_start is None:
+            return None
+
+        dirty = self._dirty_start, len(self)
+        self._dirty_start = None
+        return dirty
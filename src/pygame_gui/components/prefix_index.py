@@ -0,0 +1,49 @@
+import bisect
+
+# Sorts after any character that can appear in an option
+_MAX_CHARACTER = chr(0x10FFFF)
+
+
+class PrefixIndex:
+    """Sorted list of strings supporting fast prefix lookups.
+
+    Lookups are binary searches on the sorted list. Consecutive lookups of a growing
+    prefix, as when typing, only search the range matched by the previous prefix.
+    """
+
+    def __init__(self, options: list[str]):
+        self.options = sorted(options)
+        self._last_lookup = None
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def __getitem__(self, i: int) -> str:
+        return self.options[i]
+
+    def add(self, option: str):
+        bisect.insort(self.options, option)
+        self._last_lookup = None
+
+    def remove(self, option: str):
+        i = bisect.bisect_left(self.options, option)
+        if i == len(self.options) or self.options[i] != option:
+            raise ValueError(f'{option!r} is not an option')
+        del self.options[i]
+        self._last_lookup = None
+
+    def prefix_range(self, prefix: str) -> tuple[int, int]:
+        """The slice of options starting with prefix, empty (lo == hi) if there are none."""
+        lo, hi = 0, len(self.options)
+        if self._last_lookup is not None and prefix.startswith(self._last_lookup[0]):
+            _, lo, hi = self._last_lookup
+
+        lo = bisect.bisect_left(self.options, prefix, lo, hi)
+        hi = bisect.bisect_right(self.options, prefix + _MAX_CHARACTER, lo, hi)
+
+        self._last_lookup = prefix, lo, hi
+        return lo, hi
+
+    def first_match(self, prefix: str) -> int | None:
+        lo, hi = self.prefix_range(prefix)
+        return lo if lo < hi else None
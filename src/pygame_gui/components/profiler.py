@@ -0,0 +1,136 @@
+from collections import deque
+import time
+import weakref
+
+# How many samples each statistic keeps, older samples are forgotten
+DEFAULT_WINDOW = 240
+
+PERCENTILES = 50, 95, 99
+
+
+def _nearest_rank(ordered: list[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class RollingStats:
+    """Timings in seconds over the last window samples."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of the current samples, 0 if there are none."""
+        if not self.samples:
+            return 0.0
+        return _nearest_rank(sorted(self.samples), p)
+
+    def summary(self) -> dict[str, float]:
+        if not self.samples:
+            return {'count': self.count, 'mean': 0.0, 'max': 0.0, **{f'p{p}': 0.0 for p in PERCENTILES}}
+
+        ordered = sorted(self.samples)
+        summary = {'count': self.count,
+                   'mean': sum(ordered) / len(ordered),
+                   'max': ordered[-1]}
+        for p in PERCENTILES:
+            summary[f'p{p}'] = _nearest_rank(ordered, p)
+        return summary
+
+
+class Profiler:
+    """Opt-in timing of a window's frames, split into phases and per block.
+
+    Phases are timed by GUIBase.run with mark(), each block's draw_block and event handlers
+    are timed by the window while enabled. A block's draw time includes drawing its
+    children. Everything is skipped behind a single flag check while disabled.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.enabled = False
+        self.window = window
+        self._phases = {}
+        self._blocks = weakref.WeakKeyDictionary()
+        # Only set while a frame begun with the profiler enabled is being timed
+        self._frame_start = None
+        self._last_mark = None
+
+    def enable(self):
+        self.enabled = True
+        # A frame already under way when enabled isn't timed, its earlier phases were missed
+        self._frame_start = self._last_mark = None
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self._phases.clear()
+        self._blocks.clear()
+        self._frame_start = self._last_mark = None
+
+    def record(self, phase: str, seconds: float):
+        if phase not in self._phases:
+            self._phases[phase] = RollingStats(self.window)
+        self._phases[phase].record(seconds)
+
+    def record_block(self, block, kind: str, seconds: float):
+        """kind is one of 'draw', 'mouse' or 'keyboard'."""
+        stats = self._blocks.setdefault(block, {})
+        if kind not in stats:
+            stats[kind] = RollingStats(self.window)
+        stats[kind].record(seconds)
+
+    def call(self, block, kind: str, function, *args):
+        """Call function(*args), recording how long it took against block."""
+        start = time.perf_counter()
+        result = function(*args)
+        self.record_block(block, kind, time.perf_counter() - start)
+        return result
+
+    @property
+    def timing_frame(self) -> bool:
+        """True between begin_frame and end_frame of a frame begun while enabled."""
+        return self.enabled and self._frame_start is not None
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = self._last_mark = time.perf_counter()
+
+    def mark(self, phase: str):
+        """Record the time since the previous mark (or the start of the frame) against phase."""
+        if not self.timing_frame:
+            return
+
+        now = time.perf_counter()
+        self.record(phase, now - self._last_mark)
+        self._last_mark = now
+
+    def end_frame(self):
+        if self.timing_frame:
+            self.record('frame', time.perf_counter() - self._frame_start)
+        self._frame_start = self._last_mark = None
+
+    def phase_stats(self) -> dict[str, dict[str, float]]:
+        return {phase: stats.summary() for phase, stats in self._phases.items()}
+
+    def block_stats(self, kind: str = 'draw', *, top: int | None = None, key: str = 'p95') -> list[tuple]:
+        """(block, summary) pairs for kind, slowest first by key."""
+        stats = [(block, kinds[kind].summary()) for block, kinds in self._blocks.items() if kind in kinds]
+        stats.sort(key=lambda x: x[1][key], reverse=True)
+        return stats[:top]
+
+    def report(self, top: int = 10) -> dict:
+        """Everything recorded as plain data, with blocks named by class and position."""
+        return {
+            'phases': self.phase_stats(),
+            'blocks': {kind: [{'block': f'{type(block).__name__} at {block.coordinates}', **summary}
+                              for block, summary in self.block_stats(kind, top=top)]
+                       for kind in ('draw', 'mouse', 'keyboard')},
+        }
@@ -0,0 +1,45 @@
+from pygame_gui.components.base_block import Block
+from pygame_gui.components.constants import Alignment
+from pygame_gui.components.text_block import Text
+
+
+class ProfilerOverlay(Block):
+    """Shows the window profiler's frame phase percentiles, refreshed every interval ms.
+
+    Creating the overlay enables the window's profiler.
+    """
+    phases = 'frame', 'events', 'timers', 'update', 'layout', 'draw', 'text', 'display'
+    line_height = 16
+
+    def __init__(self, parent, *,
+                 interval: int = 500,
+                 priority: int = 100,
+                 colour: str | tuple[int, int, int] = 'offwhite',
+                 **kwargs):
+        kwargs.setdefault('dimensions', (260, self.line_height * (len(self.phases) + 1)))
+        super().__init__(parent, priority=priority, colour=colour, **kwargs)
+
+        self.lines = [Text(self,
+                           dimensions=(self.dimensions[0], self.line_height),
+                           coordinates=(0, i * self.line_height),
+                           colour=colour,
+                           font_size=16,
+                           text_alignment=Alignment.LEFT)
+                      for i in range(len(self.phases) + 1)]
+        self.lines[0].set_text(f'{"ms":8}{"p50":>8}{"p95":>8}{"p99":>8}')
+
+        self.root.profiler.enable()
+        self.refresh_timer = self.set_timer(self.refresh, interval)
+
+    def refresh(self):
+        stats = self.root.profiler.phase_stats()
+        for line, phase in zip(self.lines[1:], self.phases):
+            if phase in stats:
+                summary = stats[phase]
+                line.set_text(f'{phase:8}' + ''.join(f'{summary[p] * 1000:8.2f}' for p in ('p50', 'p95', 'p99')))
+            else:
+                line.set_text(f'{phase:8}{"-":>8}{"-":>8}{"-":>8}')
+
+    def __delitem__(self):
+        self.refresh_timer.cancel()
+        super().__delitem__()
@@ -0,0 +1,51 @@
+import pygame
+
+from pygame_gui.components.executor import BackgroundTask
+from pygame_gui.components.text_block import Text
+
+
+class ProgressBar(Text):
+    """A bar filling from the left as value goes from 0 to 1, labelled with the percentage.
+
+    Bind it to a task from submit() to follow the progress the task reports.
+    """
+
+    def __init__(self, parent, *,
+                 bar_colour: str | tuple[int, int, int] = 'title_colour',
+                 value: float = 0.0,
+                 **kwargs):
+        super().__init__(parent, **kwargs)
+
+        self.bar_colour = self._translate_colour_input(bar_colour)
+        self.task = None
+        self._value = None
+        self.value = value
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @value.setter
+    def value(self, value: float):
+        value = min(max(value, 0.0), 1.0)
+        if value != self._value:
+            self._value = value
+            self.set_text(f'{value:.0%}')
+            self.invalidate()
+
+    def bind(self, task: BackgroundTask):
+        """Follow task's progress from now on, filling the bar once it is done."""
+        self.task = task
+        self.value = task.progress
+        task.add_progress_callback(lambda fraction: self._task_progress(task, fraction))
+
+    def _task_progress(self, task: BackgroundTask, fraction: float):
+        # Tasks the bar has since been rebound from are ignored
+        if task is self.task and not self.deleted:
+            self.value = fraction
+
+    def blit_text(self):
+        width = round(self.dimensions[0] * self.value)
+        if width:
+            self.surface.fill(self.bar_colour, pygame.Rect(0, 0, width, self.dimensions[1]))
+        super().blit_text()
@@ -1,28 +1,32 @@
+from pygame_gui.components.constants import MouseEvents
 from pygame_gui.components.button_block import Button
 
 
 class Slider(Button):
 
-    def __init__(self, **kwargs):
+    def __init__(self, parent, *,
+                 move_limits: tuple[tuple[int, int], tuple[int, int]],
+                 dropdown,
+                 **kwargs):
 
-        self.min_limits, self.max_limits = kwargs['move_limits']
-        self.dropdown = kwargs['dropdown']
+        self.min_limits, self.max_limits = move_limits
+        self.dropdown = dropdown
         assert self.min_limits[0] <= self.max_limits[0] and self.min_limits[1] <= self.max_limits[1]
 
-        super().__init__(**kwargs)
+        super().__init__(parent, **kwargs)
 
         self.offset = [0, 0]
-        self.set_mouse_handlers({'left_mouse_down': self.hold_slider,
-                                 'left_mouse_up': self.release_slider,
-                                 'move_mouse': self.drag_slider})
+        self.set_mouse_handlers({MouseEvents.LEFT_MOUSE_DOWN: self.hold_slider,
+                                 MouseEvents.LEFT_MOUSE_UP: self.release_slider,
+                                 MouseEvents.MOVE_MOUSE: self.drag_slider})
 
     def set_x_pos(self, x_pos):
         new_x = (self.max_limits[0] - self.min_limits[0]) * x_pos + self.min_limits[0]
-        self.update_coordinates(x=new_x)
+        self.update_coordinates(x=int(new_x))
 
     def set_y_pos(self, y_pos):
         new_y = (self.max_limits[1] - self.min_limits[1]) * y_pos + self.min_limits[1]
-        self.update_coordinates(y=new_y)
+        self.update_coordinates(y=int(new_y))
 
     def update_coordinates(self, x=None, y=None):
         if x is None:
@@ -53,15 +57,15 @@ class Slider(Button):
                 y = self.coordinates[1]
 
             self.move(x=x, y=y)
-            self.dropdown.rel_scroll_list((y - self.min_limits[1]) / (self.max_limits[1] - self.min_limits[1]))
+            if self.max_limits[1] - self.min_limits[1] != 0:
+                self.dropdown.rel_scroll_list((y - self.min_limits[1]) / (self.max_limits[1] - self.min_limits[1]))
 
     def hold_slider(self, event):
         isCollision = self.check_collision(event)
         if isCollision:
-            self.held = True
             for i in range(2):
                 self.offset[i] = self.coordinates[i] - event.pos[i]
 
-    def release_slider(self, isCollision):
-        self.held = False
+    def release_slider(self, event):
+        # The button's own release handler clears held
         self.offset = [0, 0]
@@ -0,0 +1,61 @@
+from typing import Hashable
+
+import pygame
+
+
+class SpatialIndex:
+    """Uniform grid over absolute rects for finding the blocks under a point.
+
+    Each item is stored in every cell its rect overlaps, so a point lookup only has to
+    check the handful of items sharing its cell rather than every item in the index.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+
+        self._cells = {}
+        self._items = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._items
+
+    def _cells_for(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        if not rect.width or not rect.height:
+            return []
+
+        size = self.cell_size
+        return [(cell_x, cell_y)
+                for cell_x in range(rect.left // size, (rect.right - 1) // size + 1)
+                for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1)]
+
+    def insert(self, item: Hashable, rect: pygame.Rect):
+        """Add item to the index, or update its rect if it is already indexed."""
+        if item in self._items:
+            if self._items[item][0] == rect:
+                return
+            self.remove(item)
+
+        cells = self._cells_for(rect)
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(item)
+        self._items[item] = pygame.Rect(rect), cells
+
+    def remove(self, item: Hashable):
+        if item not in self._items:
+            return
+
+        _, cells = self._items.pop(item)
+        for cell in cells:
+            cell_items = self._cells[cell]
+            cell_items.discard(item)
+            if not cell_items:
+                del self._cells[cell]
+
+    def query_point(self, pos: tuple[int, int]) -> list[Hashable]:
+        """All items whose rect contains pos."""
+        cell = pos[0] // self.cell_size, pos[1] // self.cell_size
+        return [item for item in self._cells.get(cell, ())
+                if self._items[item][0].collidepoint(pos)]
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class SurfacePool:
+    """Surfaces released by deleted blocks, kept by size for blocks created later to reuse.
+
+    Idle surfaces are held up to max_bytes in total, the least recently released being
+    freed first. Pooled surfaces are converted to the display format, so the pool empties
+    itself when pygame is shut down.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 2 ** 20):
+        # size -> idle surfaces of that size
+        self._buckets = {}
+        # Every idle surface, least recently released first
+        self._idle = OrderedDict()
+        self._max_bytes = max_bytes
+        self._clear_on_quit = False
+
+        self.pooled_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._evict()
+
+    @staticmethod
+    def _size_of(surface: pygame.Surface) -> int:
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    def acquire(self, dimensions: tuple[int, int]) -> pygame.Surface:
+        """A surface of dimensions in the display format. Its contents are undefined."""
+        dimensions = tuple(dimensions)
+        bucket = self._buckets.get(dimensions)
+        if bucket:
+            self.hits += 1
+            surface = bucket.pop()
+            del self._idle[surface]
+            self.pooled_bytes -= self._size_of(surface)
+            return surface
+
+        self.misses += 1
+        return pygame.Surface(dimensions).convert()
+
+    def release(self, surface: pygame.Surface):
+        """Return a surface from acquire() once nothing draws on or blits from it any more."""
+        if not self._clear_on_quit:
+            # pygame forgets quit callbacks once called, so this is registered again each init
+            pygame.register_quit(self.clear)
+            self._clear_on_quit = True
+
+        size = surface.get_size()
+        self._buckets.setdefault(size, []).append(surface)
+        self._idle[surface] = size
+        self.pooled_bytes += self._size_of(surface)
+        self._evict()
+
+    def _evict(self):
+        while self.pooled_bytes > self._max_bytes:
+            surface, size = self._idle.popitem(last=False)
+            bucket = self._buckets[size]
+            bucket.remove(surface)
+            if not bucket:
+                del self._buckets[size]
+            self.pooled_bytes -= self._size_of(surface)
+            self.evictions += 1
+
+    def clear(self):
+        self._buckets.clear()
+        self._idle.clear()
+        self._clear_on_quit = False
+        self.pooled_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
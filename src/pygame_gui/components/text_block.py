@@ -1,15 +1,21 @@
-import pygame
-
 from pygame_gui.components.constants import MARGIN, Alignment
 from pygame_gui.components.base_block import Block
+from pygame_gui.components.font_registry import FontRegistry
+from pygame_gui.components.text_cache import TextCache
 
 
 class Text(Block):
+    # Shared by every Text block, resize with Text.text_cache.max_size
+    text_cache = TextCache()
+    font_registry = FontRegistry()
 
     def __init__(self, parent, *,
                  text_value='',
                  font_colour: str | tuple[int, int, int] = 'black',
                  font_size: int = 20,
+                 font_file: str | None = None,
+                 bold: bool = False,
+                 italic: bool = False,
                  text_alignment: Alignment | str = Alignment.CENTRE,
                  **kwargs
                  ):
@@ -17,45 +23,76 @@ class Text(Block):
 
         self.text_info = {
             'value': str(text_value),
+            # 'key': tuple, the inputs 'surface' and 'aligned_rect' were rendered from
             # 'surface': Surface,
-            # 'rect': tuple[int, int]
+            # 'aligned_rect': Rect,
+            # 'rect': Rect
         }
 
         self.font_colour = font_colour
-        if isinstance(font_colour, str):
-            self.font_colour = self.colour_palette[self.font_colour]
 
         self.font_size = font_size
-
-        try:
-            self.font = pygame.font.Font(None, self.font_size)
-        except pygame.error:
-            pygame.init()
-            self.font = pygame.font.Font(None, self.font_size)
+        self.font = self.font_registry.get(font_file, self.font_size, bold=bold, italic=italic)
 
         self.text_alignment = text_alignment
-        if isinstance(self.text_alignment, str):
-            self.text_alignment = self.alignment_mapping[self.text_alignment]
-        assert self.text_alignment in (Alignment.LEFT | Alignment.CENTRE | Alignment.RIGHT)
+
+    @property
+    def font_colour(self) -> tuple[int, int, int]:
+        return self._font_colour
+
+    @font_colour.setter
+    def font_colour(self, font_colour: str | tuple[int, int, int]):
+        if isinstance(font_colour, str):
+            font_colour = self.colour_palette[font_colour]
+        self._font_colour = font_colour
+        self.text_info.pop('key', None)
+        self.invalidate()
+
+    @property
+    def text_alignment(self) -> Alignment:
+        return self._text_alignment
+
+    @text_alignment.setter
+    def text_alignment(self, text_alignment: Alignment | str):
+        if isinstance(text_alignment, str):
+            text_alignment = self.alignment_mapping[text_alignment]
+        assert text_alignment in (Alignment.LEFT | Alignment.CENTRE | Alignment.RIGHT)
+        self._text_alignment = text_alignment
+        self.text_info.pop('key', None)
+        self.invalidate()
+
+    def resize(self, dimensions: tuple[int, int]):
+        super().resize(dimensions)
+        # The text is aligned within the block, so has to be realigned
+        self.text_info.pop('key', None)
 
     def update_text(self):
-        centre_coords = [int(n // 2) for n in self.dimensions]
-
-        self.text_info['surface'] = self.font.render(self.text_info['value'], True, self.font_colour)
-        if self.text_alignment == Alignment.LEFT:
-            self.text_info['rect'] = (self.text_info['surface'].get_rect(
-                left=MARGIN,
-                centery=centre_coords[1]))
-        elif self.text_alignment == Alignment.CENTRE:
-            self.text_info['rect'] = (self.text_info['surface'].get_rect(
-                center=centre_coords))
-        elif self.text_alignment == Alignment.RIGHT:
-            self.text_info['rect'] = (self.text_info['surface'].get_rect(
-                right=(self.dimensions[0] - MARGIN),
-                centery=centre_coords[1]))
+        # Only render and realign when the displayed text has actually changed
+        key = self.text_info['value'], self.font_colour, self.text_alignment
+        if self.text_info.get('key') != key:
+            self.text_info['key'] = key
+            self.text_info['surface'] = self.text_cache.render(self.font, self.text_info['value'], self.font_colour)
+
+            centre_coords = [int(n // 2) for n in self.dimensions]
+            if self.text_alignment == Alignment.LEFT:
+                self.text_info['aligned_rect'] = (self.text_info['surface'].get_rect(
+                    left=MARGIN,
+                    centery=centre_coords[1]))
+            elif self.text_alignment == Alignment.CENTRE:
+                self.text_info['aligned_rect'] = (self.text_info['surface'].get_rect(
+                    center=centre_coords))
+            elif self.text_alignment == Alignment.RIGHT:
+                self.text_info['aligned_rect'] = (self.text_info['surface'].get_rect(
+                    right=(self.dimensions[0] - MARGIN),
+                    centery=centre_coords[1]))
+
+        self.text_info['rect'] = self.text_info['aligned_rect'].copy()
 
     def set_text(self, text: str):
-        self.text_info['value'] = text
+        if text != self.text_info['value']:
+            self.text_info['value'] = text
+            self.text_info.pop('key', None)
+            self.invalidate()
 
     def get_text(self) -> str:
         return self.text_info['value']
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+import time
+
+import pygame
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, font, colour, antialias).
+
+    The surfaces returned are shared between every block displaying the same text, so they
+    must only ever be blitted from and never drawn on.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self._surfaces = OrderedDict()
+        self._max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+        # Total time spent rendering text on misses, for profiling
+        self.render_seconds = 0.0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int):
+        self._max_size = max_size
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def _evict(self):
+        while len(self._surfaces) > self._max_size:
+            self._surfaces.popitem(last=False)
+
+    def render(self, font: pygame.font.Font, text: str, colour: tuple[int, int, int], antialias: bool = True) -> pygame.Surface:
+        key = text, font, colour, antialias
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        start = time.perf_counter()
+        surface = font.render(text, antialias, colour)
+        self.render_seconds += time.perf_counter() - start
+        self._surfaces[key] = surface
+        self._evict()
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.render_seconds = 0.0
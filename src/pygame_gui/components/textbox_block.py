@@ -1,13 +1,20 @@
-import time
+import bisect
 
 import pygame
-import pyperclip
 
 from pygame_gui.components.constants import KMOD_BASE, MARGIN, Alignment, KeyboardModifiers, MouseEvents
 from pygame_gui.components.button_block import Button
+from pygame_gui.components.gap_buffer import GapBuffer
 
 
 class TextBox(Button):
+    """An editable line of text.
+
+    Edits go to a gap buffer and the displayed text is synced from it and rendered once per
+    frame, when the box is drawn. That render is still of the whole string, only the widths
+    used to place the cursor are updated from the first changed character on.
+    """
+    focusable = True
     tb_colours = {
         True: 'white',
         False: 'offwhite'
@@ -25,8 +32,14 @@ class TextBox(Button):
             text_alignment=Alignment.LEFT,
             **kwargs)
 
-        self.active = active
-        self.last_tick_time = time.time()
+        # Edits go to the buffer, text_info['value'] is only rebuilt from it when read
+        self.buffer = GapBuffer(self.text_info['value'])
+        self._text_stale = False
+        # prefix_widths[i] is the rendered width of the first i characters, kept up to date from the buffer's dirty range
+        self.prefix_widths = [0]
+
+        self.active = False
+        self.cursor_timer = None
         self.shift_held = False
 
         self.cursor_info = {
@@ -36,39 +49,62 @@ class TextBox(Button):
             # 'rect': tuple[int, int]
         }
         self.set_mouse_handlers({MouseEvents.LEFT_MOUSE_DOWN: self.check_for_select})
+        if active:
+            self.root.focus.set_focus(self)
 
     def check_for_select(self, event):
+        # Clicks elsewhere are handled by the window's focus manager
         if self.check_collision(event):
-            self.active = True
-        else:
-            self.cursor_info['on'] = False
-            if self.active:
-                self.move_cursor(end=True)
-            self.active = False
+            self.root.focus.set_focus(self)
+            self.place_cursor(self.cursor_location_at(event.pos[0] - self.overall_coords[0]))
 
+    def focus_gained(self):
+        self.active = True
+        self.restart_cursor_blink()
         self.colour = self.colour_palette[self.tb_colours[self.active]]
 
-    def update_cursor(self):
+    def focus_lost(self):
+        self.cursor_info['on'] = False
+        self.move_cursor(end=True)
+        self.active = False
+        self.cursor_timer.cancel()
+        self.cursor_timer = None
+        self.colour = self.colour_palette[self.tb_colours[self.active]]
 
-        cursor_colour = self.font_colour if self.cursor_info['on'] else self.colour
-        self.cursor_info['surface'] = self.font.render('|', True, cursor_colour)
-
-        if self.text_alignment == Alignment.LEFT:
-            # TODO: Get better letter width
-            self.cursor_info['rect'] = (self.cursor_info['surface'].get_rect(
-                left=self.cursor_info['location'] * 7 + MARGIN,
-                centery=self.text_info['rect'].centery))
-        elif self.text_alignment == Alignment.CENTRE:
-            self.cursor_info['rect'] = (self.cursor_info['surface'].get_rect(
-                left=MARGIN,
-                centery=self.text_info['rect'].centery))
-        elif self.text_alignment == Alignment.RIGHT:
-            self.cursor_info['rect'] = (self.cursor_info['surface'].get_rect(
-                right=MARGIN,
-                centery=self.text_info['rect'].centery))
+    def restart_cursor_blink(self):
+        """Show the cursor and start its blink cycle again, e.g. after a key press."""
+        if self.cursor_timer is not None:
+            self.cursor_timer.cancel()
+        self.cursor_timer = self.set_timer(self.toggle_cursor, int(self.cursor_tick_time * 1000))
+
+        self.cursor_info['on'] = True
+        self.invalidate(self.cursor_info.get('rect'))
+
+    def update_cursor(self):
+        # Shared with every other text box using the same font and colour
+        self.cursor_info['surface'] = self.text_cache.render(self.font, '|', self.font_colour)
+
+        # The cursor sits just after the first `location` characters
+        self.cursor_info['rect'] = (self.cursor_info['surface'].get_rect(
+            centerx=self.text_info['rect'].left + self.prefix_widths[self.cursor_info['location']],
+            centery=self.text_info['rect'].centery))
+
+    def cursor_location_at(self, x: int) -> int:
+        """The cursor location nearest to x, measured from the left of the text box."""
+        self.update_text()
+        x -= self.text_info['rect'].left
+
+        i = bisect.bisect_left(self.prefix_widths, x)
+        if i == len(self.prefix_widths):
+            return i - 1
+        if i > 0 and x - self.prefix_widths[i - 1] < self.prefix_widths[i] - x:
+            return i - 1
+        return i
 
     def toggle_cursor(self):
         self.cursor_info['on'] = not self.cursor_info['on']
+        # Only the cursor itself needs redrawing
+        self.invalidate(self.cursor_info.get('rect'))
 
     def move_cursor(self, amount: int = None, *, start=False, end=False):
         if amount:
@@ -76,41 +112,68 @@ class TextBox(Button):
         elif start:
             new_location = 0
         elif end:
-            new_location = len(self.text_info['value'])
+            new_location = len(self.buffer)
         else:
             raise ValueError
 
-        new_location = max(
-            new_location,
-            0)
-        new_location = min(
-            new_location,
-            len(self.text_info['value']))
+        self.place_cursor(new_location)
 
-        self.cursor_info['location'] = new_location
+    def place_cursor(self, location: int):
+        location = max(
+            location,
+            0)
+        location = min(
+            location,
+            len(self.buffer))
+
+        self.cursor_info['location'] = location
+        self.invalidate()
+
+    def _sync_text(self):
+        if self._text_stale:
+            self.text_info['value'] = str(self.buffer)
+            self._text_stale = False
+
+    def _text_changed(self):
+        self._text_stale = True
+        self.invalidate()
+
+    def _update_prefix_widths(self):
+        dirty = self.buffer.take_dirty()
+        if dirty is None:
+            return
+
+        # Rendered text isn't as wide as its glyph advances added up, so each prefix is measured
+        # as a whole. Widths before the first changed character are still valid.
+        start, _ = dirty
+        text = self.text_info['value']
+        del self.prefix_widths[start + 1:]
+        self.prefix_widths.extend(self.font.size(text[:i])[0] for i in range(start + 1, len(text) + 1))
 
     def update_text(self):
+        self._sync_text()
         super().update_text()
+        self._update_prefix_widths()
 
         if self.active:
-            # Force right align if text is wider than text box
-            if self.text_info['rect'].width + self.cursor_info['rect'].width > (self.dimensions[0] - 2 * MARGIN):
-                self.text_info['rect'] = (self.text_info['surface'].get_rect(
-                    right=(self.dimensions[0] - MARGIN) - self.cursor_info['rect'].width,
-                    centery=self.text_info['rect'].centery))
-
-            # Toggle cursor if cursor_tick_time has elapsed
-            current_time = time.time()
-            if self.last_tick_time + self.cursor_tick_time < current_time:
-                self.toggle_cursor()
-                self.last_tick_time = current_time
+            # Force right align if text is wider than text box, but keep the cursor in view
+            cursor_width = self.font.size('|')[0]
+            if self.text_info['rect'].width + cursor_width > (self.dimensions[0] - 2 * MARGIN):
+                left = (self.dimensions[0] - MARGIN) - cursor_width - self.text_info['rect'].width
+                cursor_x = left + self.prefix_widths[self.cursor_info['location']]
+                self.text_info['rect'].left = left + max(0, MARGIN - cursor_x)
 
         self.update_cursor()
 
     def set_text(self, text: str):
-        super().set_text(text)
+        self.buffer.set_text(text)
+        self._text_changed()
         self.cursor_info['location'] = len(text)
 
+    def get_text(self) -> str:
+        self._sync_text()
+        return super().get_text()
+
     def _is_modified_by(self, event, modifiers: KeyboardModifiers):
         for modifier in modifiers:
             if not event.mod & modifier:
@@ -124,18 +187,21 @@ class TextBox(Button):
         return True
 
     def _handle_ctrl_modified_commands(self, event):
+        # Imported here as finding the system clipboard is slow and only needed once it is used
+        import pyperclip
+
         character = pygame.key.name(event.key)
         if character == 'x':
-            pyperclip.copy(self.text_info['value'])
-            self.text_info['value'] = ''
+            pyperclip.copy(self.get_text())
+            self.set_text('')
         elif character == 'c':
-            pyperclip.copy(self.text_info['value'])
+            pyperclip.copy(self.get_text())
         elif character == 'v':
             text = pyperclip.paste()
-            self.text_info['value'] = text
+            self.set_text(text)
 
         elif event.key == pygame.K_BACKSPACE:
-            self.text_info['value'] = ''
+            self.set_text('')
         elif event.key == pygame.K_DELETE:
             pass
         elif event.key == pygame.K_LEFT:
@@ -147,9 +213,9 @@ class TextBox(Button):
             self.log.debug(f'Get to this... (ctrl {character})')
 
     def insert_text(self, text: str):
-        i = self.cursor_info['location']
-        self.text_info['value'] = self.text_info['value'][:i] + text + self.text_info['value'][i:]
+        self.buffer.insert(self.cursor_info['location'], text)
         self.cursor_info['location'] += len(text)
+        self._text_changed()
 
     def remove_text(self, length=1):
         pass
@@ -159,17 +225,17 @@ class TextBox(Button):
         if unicode_val == '\x08':  # Backspace
             if i == 0:
                 return
-            self.text_info['value'] = self.text_info['value'][:i - 1] + self.text_info['value'][i:]
+            self.buffer.delete(i - 1)
             self.cursor_info['location'] -= 1
 
         elif unicode_val == '\x7f':  # Delete
-            if i == len(self.text_info['value']):
+            if i == len(self.buffer):
                 return
-            self.text_info['value'] = self.text_info['value'][:i] + self.text_info['value'][i + 1:]
+            self.buffer.delete(i)
 
-    def keyboard_event_handler(self, event):
-        super().keyboard_event_handler(event)
+        self._text_changed()
 
+    def keyboard_event_handler(self, event) -> bool:
         movement_keys = {
             pygame.K_HOME: lambda *_: self.move_cursor(start=True),
             pygame.K_END: lambda *_: self.move_cursor(end=True),
@@ -185,38 +251,48 @@ class TextBox(Button):
             '\x7f': lambda *_: self._handle_delete_input('\x7f'),
         }
 
-        if self.active:
-            self.cursor_info['on'] = True
-            self.last_tick_time = time.time()
+        if not self.active:
+            return False
+
+        if (event.type == pygame.KEYDOWN and event.unicode and not event.unicode.isprintable()
+                and event.unicode not in unique_unicode_actions
+                and not KeyboardModifiers(event.mod) & KeyboardModifiers.CTRL):
+            # Leave other control characters (e.g. escape) to the blocks above
+            return False
 
-            if event.type == pygame.KEYUP:
-                if event.key in {pygame.K_LSHIFT,
-                                 pygame.K_RSHIFT}:
-                    self.shift_held = False
+        self.restart_cursor_blink()
 
-            if event.type == pygame.KEYDOWN:
-                self.log.debug(f"({event.key=}, {event.type=}, {event.mod=}, {event.unicode=}, name={pygame.key.name(event.key)}) received by {self}")
+        if event.type == pygame.KEYUP:
+            if event.key in {pygame.K_LSHIFT,
+                             pygame.K_RSHIFT}:
+                self.shift_held = False
 
-                if KeyboardModifiers(event.mod) & KeyboardModifiers.CTRL:
-                    self.log.debug(f"ctrl + {pygame.key.name(event.key)} (unicode={repr(event.unicode)})")
-                    # self._handle_ctrl_modified_commands(event)
-                    pass
+        if event.type == pygame.KEYDOWN:
+            self.log.debug(f"({event.key=}, {event.type=}, {event.mod=}, {event.unicode=}, name={pygame.key.name(event.key)}) received by {self}")
 
-                elif event.unicode:
-                    if event.unicode in unique_unicode_actions:
-                        unique_unicode_actions[event.unicode]()
-                    else:
-                        self.insert_text(event.unicode)
+            if KeyboardModifiers(event.mod) & KeyboardModifiers.CTRL:
+                self.log.debug(f"ctrl + {pygame.key.name(event.key)} (unicode={repr(event.unicode)})")
+                # self._handle_ctrl_modified_commands(event)
+                pass
 
-                elif event.key in movement_keys:
-                    movement_keys[event.key]()
+            elif event.unicode:
+                if event.unicode in unique_unicode_actions:
+                    unique_unicode_actions[event.unicode]()
+                else:
+                    self.insert_text(event.unicode)
 
-                elif event.key in {pygame.K_LSHIFT,
-                                   pygame.K_RSHIFT}:
-                    self.shift_held = True
+            elif event.key in movement_keys:
+                movement_keys[event.key]()
 
-                self.update_text()
+            elif event.key in {pygame.K_LSHIFT,
+                               pygame.K_RSHIFT}:
+                self.shift_held = True
+
+        # The text is synced from the buffer and rendered when the box is next drawn, so a
+        # burst of key presses within a frame costs one render
+        return True
 
     def blit_text(self):
         super().blit_text()
-        self.surface.blit(self.cursor_info['surface'], self.cursor_info['rect'])
+        if self.cursor_info['on']:
+            self.surface.blit(self.cursor_info['surface'], self.cursor_info['rect'])
@@ -0,0 +1,68 @@
+from typing import Any, Callable, Hashable
+import threading
+
+import pygame
+
+# Posted to wake up an idle GUI when the first update of a frame arrives
+UPDATE_EVENT = pygame.event.custom_type()
+
+
+class UpdateQueue:
+    """Changes to blocks posted from other threads, applied on the GUI thread once a frame.
+
+    Each update has a key and only the last update posted with a key before the queue is
+    drained is applied, so a feed changing a block far faster than the frame rate costs one
+    change per frame. Updates are applied in the order their keys were first posted. Because
+    earlier updates with a key are dropped, post absolute values, e.g. move(x=..., y=...)
+    rather than move(del_x=...).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+
+        self.posted = 0
+        self.applied = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def post(self, key: Hashable, function: Callable, *args, **kwargs):
+        """Call function(*args, **kwargs) at the next drain, replacing any update posted with key."""
+        self._post(key, None, function, args, kwargs)
+
+    def _post(self, key: Hashable, target: Any, function: Callable, args: tuple, kwargs: dict):
+        with self._lock:
+            wake = not self._pending
+            self._pending[key] = target, function, args, kwargs
+            self.posted += 1
+
+        # pygame's queue is thread safe, but needs the display to exist
+        if wake and pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(UPDATE_EVENT))
+
+    def call(self, target: Any, method: str, *args, **kwargs):
+        """Call target.method(*args, **kwargs), coalesced with other calls to it.
+
+        Skipped if target is a block which has since been deleted.
+        """
+        self._post((target, method), target, getattr(target, method), args, kwargs)
+
+    def set(self, target: Any, attribute: str, value: Any):
+        """Set target.attribute to value, e.g. a block's colour. Skipped for deleted blocks."""
+        self._post((target, attribute), target, setattr, (target, attribute, value), {})
+
+    def drain(self) -> int:
+        """Apply the pending updates, returning how many were applied."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        applied = 0
+        for target, function, args, kwargs in pending.values():
+            if getattr(target, 'deleted', False):
+                continue
+            function(*args, **kwargs)
+            applied += 1
+
+        self.applied += applied
+        return applied
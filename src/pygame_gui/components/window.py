@@ -1,8 +1,124 @@
-from typing import Self
+from collections import Counter
+from typing import Any, Callable, Coroutine, Iterable, Iterator, Self
+import asyncio
+import bisect
+import heapq
+import inspect
+import itertools
 import logging
 
 import pygame
 
+from pygame_gui.components.constants import MOUSE_EVENT_LOOKUP, MouseEvents
+from pygame_gui.components.executor import BackgroundExecutor, BackgroundTask
+from pygame_gui.components.focus_manager import FocusManager
+from pygame_gui.components.profiler import Profiler
+from pygame_gui.components.spatial_index import SpatialIndex
+from pygame_gui.components.update_queue import UpdateQueue
+
+# Above this many damaged rects a frame is redrawn as a single bounding rect
+MAX_DAMAGE_RECTS = 32
+
+
+def _merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Union any overlapping rects so that no area is redrawn twice in a frame."""
+    if len(rects) > MAX_DAMAGE_RECTS:
+        return [rects[0].unionall(rects[1:])]
+
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+
+class Timer:
+    """A callback scheduled on the window, see Window.set_timer."""
+
+    def __init__(self, callback: Callable[[], None], interval: int, repeat: bool, due: int):
+        self.callback = callback
+        self.interval = interval
+        self.repeat = repeat
+        self.due = due
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Children:
+    """A block's children in drawing order: by priority, then by the order they were added.
+
+    The order is kept up to date as children are added, removed or change priority, so
+    drawing and event dispatch can iterate it directly.
+    """
+    _added_count = itertools.count()
+
+    def __init__(self):
+        self._blocks = []
+        self._keys = []
+
+    def __iter__(self) -> Iterator:
+        return iter(self._blocks)
+
+    def __reversed__(self) -> Iterator:
+        return reversed(self._blocks)
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def _index(self, block) -> int | None:
+        key = getattr(block, '_child_key', None)
+        if key is None:
+            return None
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._blocks) and self._blocks[i] is block:
+            return i
+        return None
+
+    def __contains__(self, block) -> bool:
+        return self._index(block) is not None
+
+    def add(self, block):
+        if block in self:
+            return
+        self._insert(block, (block.priority, next(self._added_count)))
+
+    def _insert(self, block, key: tuple[int, int]):
+        block._child_key = key
+        i = bisect.bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._blocks.insert(i, block)
+
+    def remove(self, block):
+        i = self._index(block)
+        if i is None:
+            raise KeyError(block)
+        del self._keys[i]
+        del self._blocks[i]
+
+    def reorder(self, block):
+        """Move block to match its current priority, keeping its place among equal priorities."""
+        i = self._index(block)
+        if i is None:
+            return
+        _, added = self._keys.pop(i)
+        self._blocks.pop(i)
+        self._insert(block, (block.priority, added))
+
+    def __getitem__(self, i: int):
+        return self._blocks[i]
+
+    def copy(self) -> list:
+        return list(self._blocks)
+
 
 class Window:
     base_colours = {
@@ -21,32 +137,213 @@ class Window:
                  caption: str = '',
                  colour: str | tuple[int, int, int] = 'white',
                  colour_palette: dict[str, tuple[int, int, int]] = None,
+                 resizable: bool = False,
+
+                 stack: str | None = None,
+                 spacing: int = 0,
                  **kwargs):
-        self.log = logging.getLogger()
+        """
+        Args:
+            stack: 'row' or 'column' to place children one after another along that axis,
+                in drawing order and spacing apart. Children then don't need a position on it.
+            spacing: Gap between stacked children.
+        """
+        self.log = logging.getLogger('pygame_gui')
 
-        self.dimensions = dimensions
+        self.surface = None
+        self._damage = []
+        self.deleted = False
+        self._init_root_state()
+
+        self.dimensions = tuple(dimensions)
+        self.depth = 0
+        self.resizable = resizable
+
+        assert stack in {None, 'row', 'column'}
+        self.stack = stack
+        self.spacing = spacing
+        # Children whose position or size follows this block's size
+        self._layout_dependents = set()
         self.colour_palette = colour_palette or self.base_colours
         self.colour = self._translate_colour_input(colour)
         self.caption = caption
 
         self.active = False
-        self.surface = None
-        self.children = set()
+        self.children = Children()
 
-        self.surface = None
+    def _init_root_state(self):
+        # State shared by the whole tree lives on the window at its root
+        self._updating = set()
+        self._timers = []
+        self._timer_count = itertools.count()
+        # Tasks started by run_coroutine which haven't finished
+        self._tasks = set()
+        # Changes posted by other threads, applied once a frame
+        self.updates = UpdateQueue()
+        # Work run off the GUI thread, its callbacks come back through updates
+        self.executor = BackgroundExecutor(self.updates)
+
+        # Bumped whenever a block moves, making every cached absolute position stale
+        self._transform_version = 0
+        # Moved blocks whose subtree hit rects are refreshed before the next mouse event
+        self._stale_hit_rects = set()
+
+        # Blocks whose children need laying out again, processed parents first by layout()
+        self._layout_queue = []
+        self._layout_queued = set()
+        self._layout_count = itertools.count()
+
+        self.hit_index = SpatialIndex()
+        self.mouse_capture = None
+        self._mouse_listeners = set()
+        self._mouse_event_counts = Counter()
+        self.focus = FocusManager(self)
+        self.profiler = Profiler()
+
+    @property
+    def root(self) -> Self:
+        return self
+
+    @property
+    def visible_rect(self) -> pygame.Rect:
+        return pygame.Rect((0, 0), self.dimensions)
+
+    def absolute_coordinates(self) -> tuple[int, int]:
+        return 0, 0
+
+    def transform_changed(self, block: Self):
+        """Record that block moved relative to its parent.
+
+        This is O(1): absolute positions are recomputed lazily when next asked for, and the
+        hit rects of block's subtree are refreshed once before the next mouse event however
+        many times it moved in between.
+        """
+        self._transform_version += 1
+        self.hit_rects_changed(block)
+
+    def hit_rects_changed(self, block: Self):
+        """Have the hit rects of block's subtree refreshed before the next mouse event."""
+        self._stale_hit_rects.add(block)
+
+    def refresh_hit_rects(self):
+        while self._stale_hit_rects:
+            self._stale_hit_rects.pop()._update_hit_rects()
+
+    def z_key(self) -> tuple:
+        """Sorts blocks by drawing order, the block drawn last is on top."""
+        return ()
+
+    @property
+    def colour(self) -> tuple[int, int, int]:
+        return self._colour
+
+    @colour.setter
+    def colour(self, colour: tuple[int, int, int]):
+        self._colour = colour
+        self.invalidate()
+
+    @property
+    def _stack_axis(self) -> int | None:
+        return {'row': 0, 'column': 1}.get(self.stack)
 
     def _create_surface(self):
         pygame.display.set_caption(self.caption)
-        self.surface = pygame.display.set_mode(self.dimensions)
+        self.surface = pygame.display.set_mode(self.dimensions, pygame.RESIZABLE if self.resizable else 0)
 
-    def draw_block(self):
-        if not self.surface:
+    def resize(self, dimensions: tuple[int, int]):
+        """Change the window size, the children that depend on it are laid out by the next layout()."""
+        dimensions = tuple(dimensions)
+        if dimensions == self.dimensions:
+            return
+
+        self.dimensions = dimensions
+        if self.surface is not None:
             self._create_surface()
+            self.invalidate()
+        self.request_layout(self)
+
+    def request_layout(self, block: Self):
+        """Have layout() reposition block's children, e.g. after block changed size."""
+        if block not in self._layout_queued:
+            self._layout_queued.add(block)
+            heapq.heappush(self._layout_queue, (block.depth, next(self._layout_count), block))
+
+    def cancel_layout(self, block: Self):
+        self._layout_queued.discard(block)
+
+    def layout(self):
+        """Lay out the children of every block that requested it, in one pass.
 
+        Parents are laid out before their children, so a block resized by its parent's layout
+        is laid out in the same pass. Only children whose geometry depends on their parent's
+        size are visited.
+        """
+        while self._layout_queue:
+            _, _, block = heapq.heappop(self._layout_queue)
+            # Skip blocks deleted or already laid out since they were queued
+            if block in self._layout_queued:
+                self._layout_queued.remove(block)
+                block._layout_children()
+
+    def _layout_children(self):
+        axis = self._stack_axis
+        children = self.children.copy() if axis is not None else list(self._layout_dependents)
+
+        offset = 0
+        for child in children:
+            coordinates, dimensions = child._layout_geometry()
+            if axis is not None:
+                coordinates = list(coordinates)
+                coordinates[axis] = offset
+                offset += dimensions[axis] + self.spacing
+
+            child.resize(dimensions)
+            if tuple(coordinates) != child.coordinates:
+                child.move(x=coordinates[0], y=coordinates[1])
+
+    def invalidate(self, rect: pygame.Rect | None = None):
+        """Mark an area of this block (in its own coordinates) as needing to be redrawn.
+
+        Nothing is recorded before the surface exists as the first draw renders everything.
+        """
+        if self.surface is None:
+            return
+
+        bounds = self.surface.get_rect()
+        rect = bounds if rect is None else bounds.clip(rect)
+        if rect.width and rect.height:
+            self._damage.append(rect)
+
+    def _render(self, area: pygame.Rect):
+        self.surface.set_clip(area)
         self.surface.fill(self.colour)
 
-        for child in sorted(self.children, key=lambda x: x.priority):
-            child.draw_block()
+        profiler = None
+        for child in self.children:
+            if area.colliderect(child.rect):
+                if profiler is None:
+                    profiler = self.root.profiler
+
+                if profiler.enabled:
+                    profiler.call(child, 'draw', child.draw_block)
+                else:
+                    child.draw_block()
+
+    def draw_block(self) -> list[pygame.Rect]:
+        """Redraw the damaged areas of this block and return them."""
+        if not self.surface:
+            self._create_surface()
+            self._damage.append(self.surface.get_rect())
+        elif not self._damage:
+            # Nothing in this subtree changed, the surface is already up to date
+            return []
+
+        damage, self._damage = _merge_rects(self._damage), []
+        for area in damage:
+            self._render(area)
+        self.surface.set_clip(None)
+
+        return damage
 
     def _translate_colour_input(self, colour):
         if isinstance(colour, str):
@@ -64,18 +361,183 @@ class Window:
                               pygame.MOUSEBUTTONUP,
                               pygame.MOUSEMOTION}
 
-        for child in self.children:
-            child.mouse_event_handler(event)
+        if (event.type, getattr(event, 'button', None)) not in MOUSE_EVENT_LOOKUP:
+            return
+
+        self.refresh_hit_rects()
+        targets = self._mouse_targets(event)
+
+        # Clicking anywhere other than the focused block takes focus away from it
+        if (event.type == pygame.MOUSEBUTTONDOWN and event.button == pygame.BUTTON_LEFT
+                and self.focus.focused is not None and self.focus.focused not in targets):
+            self.focus.clear_focus()
+
+        for block in targets:
+            # Skip blocks deleted by an earlier handler for this event
+            if block not in self.hit_index:
+                continue
+
+            if self.profiler.enabled:
+                self.profiler.call(block, 'mouse', block.mouse_event_handler, event)
+            else:
+                block.mouse_event_handler(event)
+
+    def _mouse_targets(self, event) -> list[Self]:
+        """The capturing block, then blocks under the pointer from the top down, then listeners."""
+        hits = sorted(self.hit_index.query_point(event.pos), key=lambda x: x.z_key(), reverse=True)
+
+        targets = [] if self.mouse_capture is None else [self.mouse_capture]
+        targets.extend(block for block in hits if block is not self.mouse_capture)
+        targets.extend(block for block in self._mouse_listeners if block not in targets)
+        return targets
+
+    def capture_mouse(self, block: Self):
+        """Send block every mouse event, wherever the pointer is, until release_mouse(block).
+
+        Blocks are offered the pointer from the top down, so the topmost block to ask keeps it.
+        """
+        if self.mouse_capture is None:
+            self.mouse_capture = block
+
+    def release_mouse(self, block: Self):
+        if self.mouse_capture is block:
+            self.mouse_capture = None
+
+    def add_mouse_listener(self, block: Self):
+        """Send block every mouse event, as well as the blocks under the pointer."""
+        self._mouse_listeners.add(block)
 
-    def keyboard_event_handler(self, event):
+    def remove_mouse_listener(self, block: Self):
+        self._mouse_listeners.discard(block)
+
+    def add_mouse_events(self, mouse_events: Iterable[MouseEvents]):
+        """Record that a block in the tree now handles these mouse events."""
+        self._mouse_event_counts.update(mouse_events)
+
+    def remove_mouse_events(self, mouse_events: Iterable[MouseEvents]):
+        self._mouse_event_counts.subtract(mouse_events)
+
+    def consumed_mouse_event_types(self) -> set[int]:
+        """The pygame event types that some block in the tree handles."""
+        return {mouse_event.value[0] for mouse_event, count in self._mouse_event_counts.items() if count > 0}
+
+    def keyboard_event_handler(self, event) -> bool:
+        """Send a keyboard event to the focused block. True if it was handled."""
         assert event.type in {pygame.KEYDOWN,
                               pygame.KEYUP}
 
-        for child in self.children:
-            child.keyboard_event_handler(event)
+        return self.focus.dispatch(event)
 
     def blit_text(self):
         pass
 
     def add_child(self, block: Self):
         self.children.add(block)
+
+        axis = self._stack_axis
+        if axis is not None:
+            coordinates = list(block.coordinates)
+            coordinates[axis] = 0
+            if block is not self.children[-1]:
+                self.root.request_layout(self)
+            elif len(self.children) > 1:
+                # Appending only needs the new block placed after the current last one
+                previous = self.children[-2]
+                coordinates[axis] = previous.coordinates[axis] + previous.dimensions[axis] + self.spacing
+            block.coordinates = coordinates
+
+        if block._depends_on_parent_size():
+            self._layout_dependents.add(block)
+
+        self.invalidate(block.rect)
+
+    def remove_child(self, block: Self):
+        self.children.remove(block)
+        self._layout_dependents.discard(block)
+        if self.stack is not None:
+            self.root.request_layout(self)
+        self.invalidate(block.rect)
+
+    def start_updates(self, block: Self):
+        """Have block.update() called once per frame until stop_updates(block)."""
+        self._updating.add(block)
+
+    def stop_updates(self, block: Self):
+        self._updating.discard(block)
+
+    def update(self):
+        for block in tuple(self._updating):
+            block.update()
+
+    def is_idle(self) -> bool:
+        """True when nothing needs applying, laying out or drawing and no block needs per-frame updates."""
+        return not self._updating and not self._damage and not self._layout_queued and not self.updates
+
+    def set_timer(self, callback: Callable[[], None], interval: int, *, repeat: bool = True) -> Timer:
+        """Call callback after interval ms (and every interval ms after that if repeat)."""
+        timer = Timer(callback, interval, repeat, pygame.time.get_ticks() + interval)
+        heapq.heappush(self._timers, (timer.due, next(self._timer_count), timer))
+        return timer
+
+    def time_until_next_timer(self) -> int | None:
+        """ms until the next timer is due, or None if there are no timers."""
+        while self._timers and self._timers[0][2].cancelled:
+            heapq.heappop(self._timers)
+        if not self._timers:
+            return None
+        return max(0, self._timers[0][0] - pygame.time.get_ticks())
+
+    def run_timers(self):
+        now = pygame.time.get_ticks()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, timer = heapq.heappop(self._timers)
+            if timer.cancelled:
+                continue
+
+            self.handle_result(timer.callback())
+
+            if timer.repeat and not timer.cancelled:
+                # Skip missed intervals rather than firing them all at once
+                timer.due = max(timer.due + timer.interval, now + 1)
+                heapq.heappush(self._timers, (timer.due, next(self._timer_count), timer))
+
+    def run_coroutine(self, coroutine: Coroutine, on_done: Callable[[Any], None] | None = None) -> asyncio.Task:
+        """Run coroutine as a task on the event loop the GUI is running on, see GUIBase.run_async.
+
+        on_done is called with the coroutine's result once it finishes. Like the task itself it
+        runs between frames, so it can safely update blocks. Exceptions are logged.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coroutine.close()
+            raise RuntimeError("Coroutines can only be run by a GUI started with GUIBase.run_async") from None
+
+        task = loop.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(lambda task: self._coroutine_done(task, on_done))
+        return task
+
+    def _coroutine_done(self, task: asyncio.Task, on_done: Callable[[Any], None] | None):
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self.log.error(f'Unhandled exception in {task.get_coro()}', exc_info=task.exception())
+        elif on_done is not None:
+            on_done(task.result())
+
+    def handle_result(self, result):
+        """Run the result of a handler or callback as a task if it is a coroutine."""
+        if inspect.iscoroutine(result):
+            self.run_coroutine(result)
+
+    def submit(self, function: Callable, *args, **kwargs) -> BackgroundTask:
+        """Run function in a worker thread or process, see BackgroundExecutor.submit."""
+        return self.executor.submit(function, *args, **kwargs)
+
+    async def cancel_coroutines(self):
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,3 +1,5 @@
+import logging
+
 from pygame_gui.gui_base import GUIBase
 import pygame_gui.components as gui
 from pygame_gui.components import MouseEvents
@@ -39,12 +41,15 @@ class ExampleGUI(GUIBase):
             dimensions=(160, 40),
             coordinates=(60, 200))
 
-        # gui.Dropdown(self.window,
-        #     dimensions=(16, 4),
-        #     coordinates=(18, 2))
+        gui.Dropdown(
+            self.window,
+            dimensions=(160, 40),
+            coordinates=(300, 20))
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+
     gui_inst = ExampleGUI(
         dimensions=(700, 400),
         caption="Example GUI",
@@ -10,15 +10,30 @@ Suggestions list:
  - ctrl-z and ctrl-y
  - something with ctrl-s
 """
-import logging
+import asyncio
+import time
+
 import pygame
 
 import pygame_gui.components as gui
+from pygame_gui.components.update_queue import UPDATE_EVENT
 
 
 class GUIBase:
     refresh_rate = 50
 
+    # Restrict the event queue to the events the window consumes
+    filter_events = True
+    always_allowed_events = {pygame.QUIT,
+                             pygame.KEYDOWN,
+                             pygame.KEYUP,
+                             pygame.TEXTINPUT,
+                             pygame.TEXTEDITING,
+                             pygame.WINDOWEXPOSED,
+                             pygame.VIDEOEXPOSE,
+                             pygame.VIDEORESIZE,
+                             UPDATE_EVENT}
+
     def __init__(self,
                  dimensions: tuple[int, int] | None,
                  bg_colour: str | tuple[int, int, int] = 'white',
@@ -26,8 +41,7 @@ class GUIBase:
                  **kwargs):
         """window_size, caption, win_colour, colour_palette=None -> myGUI
         """
-        logging.basicConfig(level=logging.DEBUG)
-        pygame.init()
+        self.init_pygame()
 
         self.window = gui.Window(
             dimensions=dimensions,
@@ -37,42 +51,179 @@ class GUIBase:
         )
 
         self.running = False
+        self.clock = pygame.time.Clock()
+        self._allowed_events = None
+        self.event_stats = {'merged': 0, 'dropped': 0}
         pygame.key.set_repeat(500, 50)
 
         self._keyboard_event_handlers = {}
         self.add_keyboard_event_handler(key=pygame.K_ESCAPE, callable=self.quit_gui)
 
-    def run(self):
+    @staticmethod
+    def init_pygame():
+        """Start only the pygame subsystems the GUI uses, the event queue comes with the display.
+
+        Does nothing for subsystems which are already running.
+        """
+        pygame.display.init()
+        pygame.font.init()
+        # Timers, the cursor blink and event waits all go by pygame.time.get_ticks(), which
+        # stays at 0 until SDL's timer is started. Starting the display doesn't start it, waiting does.
+        pygame.time.wait(0)
+
+    def _start(self):
         self.running = True
-        pygame.init()
+        self.init_pygame()
 
         self.window.draw_block()
         pygame.display.flip()
 
-        while self.running:
-            pygame.time.delay(int(1000 / self.refresh_rate))
+    def run(self):
+        self._start()
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.quit_gui()
+        while self.running:
+            self._update_allowed_events()
 
-                # Keyboard Events
-                if event.type in {pygame.KEYDOWN,
-                                  pygame.KEYUP}:
-                    # self.run_keyboard_event_handlers(event)
-                    self.window.keyboard_event_handler(event)
+            if self.window.is_idle():
+                events = self._wait_for_events()
+            else:
+                events = pygame.event.get()
 
-                # Mouse Events
-                if event.type in {pygame.MOUSEBUTTONDOWN,
-                                  pygame.MOUSEBUTTONUP,
-                                  pygame.MOUSEMOTION}:
-                    self.window.mouse_event_handler(event)
+            self._run_frame(events)
 
-            self.window.draw_block()
-            pygame.display.flip()
+            # Waits out whatever is left of the frame after the work above
+            self.clock.tick(self.refresh_rate)
 
+        self.window.executor.shutdown()
         pygame.quit()
 
+    async def run_async(self):
+        """Run the GUI as a coroutine, yielding to the asyncio event loop between frames.
+
+        Handlers and timer callbacks may be coroutine functions, their coroutines are run as
+        tasks on the same event loop (see Window.run_coroutine), so they can await I/O without
+        stopping frames being drawn. Tasks still running when the GUI quits are cancelled.
+        """
+        self._start()
+        frame_time = 1 / self.refresh_rate
+
+        try:
+            while self.running:
+                frame_start = time.perf_counter()
+                self._update_allowed_events()
+                self._run_frame(pygame.event.get())
+
+                # pygame can't wait for events without blocking the event loop, so even an idle
+                # window polls once a frame, idle frames have nothing to draw though
+                await asyncio.sleep(max(0.0, frame_time - (time.perf_counter() - frame_start)))
+        finally:
+            await self.window.cancel_coroutines()
+            self.window.executor.shutdown()
+            pygame.quit()
+
+    def _run_frame(self, events: list[pygame.event.Event]):
+        """Handle one frame's events, then update, lay out and draw the window."""
+        profiler = self.window.profiler
+        text_cache = gui.Text.text_cache
+
+        profiler.begin_frame()
+        text_seconds = text_cache.render_seconds
+
+        for event in self._preprocess_events(events):
+            if event.type == pygame.QUIT:
+                self.quit_gui()
+
+            # The display needs repainting after being covered
+            if event.type in {pygame.WINDOWEXPOSED,
+                              pygame.VIDEOEXPOSE}:
+                self.window.invalidate()
+
+            if event.type == pygame.VIDEORESIZE:
+                self.window.resize(event.size)
+
+            # Keyboard Events
+            if event.type in {pygame.KEYDOWN,
+                              pygame.KEYUP}:
+                # Events the focused block and its ancestors don't handle come back to the GUI
+                if not self.window.keyboard_event_handler(event):
+                    self.run_keyboard_event_handlers(event)
+
+            # Mouse Events
+            if event.type in {pygame.MOUSEBUTTONDOWN,
+                              pygame.MOUSEBUTTONUP,
+                              pygame.MOUSEMOTION}:
+                self.window.mouse_event_handler(event)
+        profiler.mark('events')
+
+        self.window.run_timers()
+        profiler.mark('timers')
+        # Changes posted from other threads since the last frame
+        self.window.updates.drain()
+        self.window.update()
+        profiler.mark('update')
+
+        # Reposition whatever depends on sizes that changed this frame
+        self.window.layout()
+        profiler.mark('layout')
+
+        # Only push the areas that were redrawn this frame to the display
+        damage = self.window.draw_block()
+        profiler.mark('draw')
+        if damage:
+            pygame.display.update(damage)
+        profiler.mark('display')
+
+        if profiler.timing_frame:
+            # Text rendered during the frame, this is also part of the draw time
+            profiler.record('text', text_cache.render_seconds - text_seconds)
+        profiler.end_frame()
+
+    def _update_allowed_events(self):
+        if not self.filter_events:
+            return
+
+        allowed = self.always_allowed_events | self.window.consumed_mouse_event_types()
+        if allowed != self._allowed_events:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(allowed))
+            self._allowed_events = allowed
+
+    def _preprocess_events(self, events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+        """Drop events nothing consumes and merge consecutive mouse motion into a single event."""
+        processed = []
+        merged = dropped = 0
+
+        for event in events:
+            if self._allowed_events is not None and event.type not in self._allowed_events:
+                dropped += 1
+                continue
+
+            if event.type == pygame.MOUSEMOTION and processed and processed[-1].type == pygame.MOUSEMOTION:
+                previous = processed[-1]
+                rel = previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1]
+                processed[-1] = pygame.event.Event(pygame.MOUSEMOTION, {**event.dict, 'rel': rel})
+                merged += 1
+                continue
+
+            processed.append(event)
+
+        self.event_stats = {'merged': merged, 'dropped': dropped}
+        return processed
+
+    def _wait_for_events(self) -> list[pygame.event.Event]:
+        """Block until an event arrives or the next timer is due."""
+        timeout = self.window.time_until_next_timer()
+        if timeout is None:
+            event = pygame.event.wait()
+        elif timeout > 0:
+            event = pygame.event.wait(timeout)
+        else:
+            return pygame.event.get()
+
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
     def quit_gui(self):
         self.running = False
 
@@ -87,11 +238,11 @@ class GUIBase:
         self._keyboard_event_handlers[(mod, key, type)] = callable
 
     def run_keyboard_event_handlers(self, event):
-        for (mod, key, type), callable in self._keyboard_event_handlers:
+        for (mod, key, type), callable in self._keyboard_event_handlers.items():
 
             mod_match = (mod is None) or (event.mod == mod)
             key_match = (key is None) or (event.key == key)
             type_match = (type is None) or (event.type == type)
 
             if mod_match and key_match and type_match:
-                callable()
+                self.window.handle_result(callable())
@@ -0,0 +1,256 @@
+"""
+Builds widget trees from JSON or TOML layout files.
+
+A layout file holds a list of widgets under "widgets". Each widget has a "type", optionally
+an "id", "children" and "handlers", and otherwise the keyword arguments of its constructor:
+
+    {"widgets": [
+        {"type": "Block", "id": "panel", "dimensions": [200, 100], "coordinates": [10, 10],
+         "stack": "column", "children": [
+            {"type": "Text", "dimensions": [200, 40], "coord_x": 0, "text_value": "Title"},
+            {"type": "Button", "id": "quit", "dimensions": [200, 40], "coord_x": 0,
+             "text_value": "QUIT", "handlers": {"LEFT_MOUSE_UP": "on_quit"}}
+        ]}
+    ]}
+
+Alignments are given by name, e.g. "right" or "left|right", and handlers by the name of a
+callable in the mapping or object passed when the layout is built, called with the event.
+"""
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tomllib
+from typing import Any, Callable
+
+import pygame_gui.components as gui
+from pygame_gui.components import Alignment, MouseEvents
+
+WIDGET_TYPES = {widget_type.__name__: widget_type
+                for widget_type in (gui.Block, gui.Text, gui.Button, gui.TextBox, gui.Dropdown)}
+
+ALIGNMENT_KEYS = {'alignment', 'align_x', 'align_y', 'text_alignment'}
+# Keys given as lists in the file which the constructors take as tuples
+TUPLE_KEYS = {'coordinates', 'dimensions', 'margin', 'colour', 'font_colour'}
+STRUCTURE_KEYS = {'type', 'id', 'children', 'handlers'}
+
+# Bumped whenever the compiled form changes, so stale cache files are ignored
+CACHE_VERSION = 2
+
+
+def _constructor_arguments(widget_type: type) -> set[str]:
+    """Every keyword argument the constructors of widget_type and its bases accept."""
+    arguments = set()
+    for cls in widget_type.__mro__:
+        if '__init__' in vars(cls):
+            arguments.update(name for name, parameter in inspect.signature(cls.__init__).parameters.items()
+                             if parameter.kind in {parameter.KEYWORD_ONLY, parameter.POSITIONAL_OR_KEYWORD})
+    return arguments - {'self', 'parent'}
+
+
+_ARGUMENTS = {name: _constructor_arguments(widget_type) for name, widget_type in WIDGET_TYPES.items()}
+
+
+def _alignment(where: str, value: str) -> Alignment:
+    alignment = Alignment(0)
+    for name in value.split('|'):
+        name = name.strip().lower()
+        if name not in gui.Block.alignment_mapping:
+            raise ValueError(f"{where}: unknown alignment {name!r}")
+        alignment |= gui.Block.alignment_mapping[name]
+    return alignment
+
+
+def _compile_value(where: str, key: str, value: Any) -> Any:
+    if key in ALIGNMENT_KEYS:
+        if isinstance(value, list):
+            return tuple(_alignment(where, item) for item in value)
+        return _alignment(where, value)
+    if key in TUPLE_KEYS and isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _check_geometry(where: str, kwargs: dict, checked_axes: tuple[int, ...]):
+    """Catch mistakes in a widget's size and position before anything is built.
+
+    Only axes in checked_axes are checked for missing positions, those of widgets at the top of
+    the layout depend on the parent they're built in and are left to the widget to check.
+    """
+    dimensions = kwargs.get('dimensions')
+    if (not isinstance(dimensions, tuple) or len(dimensions) != 2
+            or not all(isinstance(n, int) and n >= 0 for n in dimensions)):
+        raise ValueError(f"{where}: dimensions must be a pair of non-negative integers, not {dimensions!r}")
+
+    if kwargs.get('stack') not in {None, 'row', 'column'}:
+        raise ValueError(f"{where}: stack must be 'row' or 'column', not {kwargs['stack']!r}")
+
+    for axis, name in enumerate('xy'):
+        has_coordinate = kwargs.get('coordinates') is not None or kwargs.get(f'coord_{name}') is not None
+        has_alignment = kwargs.get('alignment') is not None or kwargs.get(f'align_{name}') is not None
+        if has_coordinate and has_alignment:
+            raise ValueError(f"{where}: the {name} position has been over-constrained")
+        if not has_coordinate and not has_alignment and axis in checked_axes:
+            raise ValueError(f"{where}: the {name} position has been under-constrained")
+
+
+def _compile_widget(where: str, spec: Any, ids: set[str], checked_axes: tuple[int, ...] = ()) -> tuple:
+    if not isinstance(spec, dict):
+        raise TypeError(f"{where}: a widget must be a table, not {type(spec).__name__}")
+
+    type_name = spec.get('type')
+    if type_name not in WIDGET_TYPES:
+        raise ValueError(f"{where}: unknown widget type {type_name!r}")
+
+    unknown = set(spec) - STRUCTURE_KEYS - _ARGUMENTS[type_name]
+    if unknown:
+        raise ValueError(f"{where}: {type_name} has no argument(s) {', '.join(sorted(unknown))}")
+
+    widget_id = spec.get('id')
+    if widget_id is not None:
+        if widget_id in ids:
+            raise ValueError(f"{where}: duplicate id {widget_id!r}")
+        ids.add(widget_id)
+
+    handlers = spec.get('handlers', {})
+    if handlers and not issubclass(WIDGET_TYPES[type_name], gui.Button):
+        raise ValueError(f"{where}: only buttons take handlers")
+    for event_name in handlers:
+        if event_name not in MouseEvents.__members__:
+            raise ValueError(f"{where}: unknown mouse event {event_name!r}")
+
+    kwargs = {key: _compile_value(where, key, value) for key, value in spec.items() if key not in STRUCTURE_KEYS}
+    _check_geometry(where, kwargs, checked_axes)
+
+    # Children are positioned by this widget along the axis it stacks them on
+    stack_axis = {'row': 0, 'column': 1}.get(kwargs.get('stack'))
+    child_axes = tuple(axis for axis in (0, 1) if axis != stack_axis)
+    children = tuple(_compile_widget(f'{where}.children[{i}]', child, ids, child_axes)
+                     for i, child in enumerate(spec.get('children', ())))
+
+    return type_name, widget_id, kwargs, tuple(handlers.items()), children
+
+
+def compile_layout(layout: dict) -> tuple:
+    """Validate a parsed layout file, returning it in the form LayoutLoader.build takes."""
+    if not isinstance(layout, dict) or not isinstance(layout.get('widgets'), list):
+        raise ValueError("A layout needs a list of widgets under 'widgets'")
+
+    ids = set()
+    return tuple(_compile_widget(f'widgets[{i}]', spec, ids) for i, spec in enumerate(layout['widgets']))
+
+
+class LayoutLoader:
+    """Loads layout files, keeping each compiled layout for as long as its file is unchanged.
+
+    With a cache_dir, compiled layouts are also written there so that later runs skip parsing
+    and validating files that haven't changed. Cache files are pickles, which can run code when
+    loaded, so cache_dir must only be writable by users trusted to run code in the program.
+    """
+
+    def __init__(self, *, cache_dir: str | None = None):
+        self.cache_dir = cache_dir
+        self._compiled = {}
+
+    def _cache_file(self, path: str) -> str:
+        name = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f'{name}.pickle')
+
+    def compile(self, path: str) -> tuple:
+        stat = os.stat(path)
+        key = CACHE_VERSION, stat.st_mtime_ns, stat.st_size
+
+        cached = self._compiled.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        compiled = None
+        if self.cache_dir is not None:
+            # Cached layouts are keyed on the file's contents, which unlike its modification
+            # time can't be left unchanged by an edit
+            source_key = CACHE_VERSION, hashlib.sha1(data).hexdigest()
+            try:
+                with open(self._cache_file(path), 'rb') as f:
+                    cached_key, cached_layout = pickle.load(f)
+                if cached_key == source_key:
+                    compiled = cached_layout
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+                pass
+
+        if compiled is None:
+            if path.endswith('.toml'):
+                layout = tomllib.loads(data.decode())
+            else:
+                layout = json.loads(data)
+            compiled = compile_layout(layout)
+
+            if self.cache_dir is not None:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(self._cache_file(path), 'wb') as f:
+                    pickle.dump((source_key, compiled), f)
+
+        self._compiled[path] = key, compiled
+        return compiled
+
+    def load(self, path: str, parent, handlers: dict[str, Callable] | object | None = None) -> dict[str, Any]:
+        """Build the layout in path inside parent, returning the widgets that have an id."""
+        return self.build(self.compile(path), parent, handlers)
+
+    def build(self, compiled: tuple, parent, handlers: dict[str, Callable] | object | None = None) -> dict[str, Any]:
+        """Build a compiled layout inside parent, returning the widgets that have an id.
+
+        handlers is a mapping of names to callables, or an object whose attributes are looked
+        up by name. Every handler is resolved before anything is built. Positions can only be
+        checked against the parent as widgets are built, if a widget can't be built the ones
+        built before it are deleted again, leaving parent as it was.
+        """
+        resolved = {}
+        self._resolve_handlers(compiled, handlers, resolved)
+
+        widgets = {}
+        built = []
+        try:
+            for i, widget in enumerate(compiled):
+                self._build_widget(f'widgets[{i}]', widget, parent, resolved, widgets, built)
+        except Exception:
+            for block in reversed(built):
+                if not block.deleted:
+                    block.__delitem__()
+            raise
+        return widgets
+
+    def _resolve_handlers(self, compiled: tuple, handlers, resolved: dict[str, Callable]):
+        for _, _, _, widget_handlers, children in compiled:
+            for _, name in widget_handlers:
+                if name in resolved:
+                    continue
+                if isinstance(handlers, dict):
+                    handler = handlers.get(name)
+                else:
+                    handler = getattr(handlers, name, None)
+                if not callable(handler):
+                    raise ValueError(f"No handler called {name!r}")
+                resolved[name] = handler
+            self._resolve_handlers(children, handlers, resolved)
+
+    def _build_widget(self, where: str, widget: tuple, parent, resolved: dict[str, Callable],
+                      widgets: dict[str, Any], built: list):
+        type_name, widget_id, kwargs, widget_handlers, children = widget
+
+        try:
+            block = WIDGET_TYPES[type_name](parent, **kwargs)
+        except (ValueError, TypeError) as error:
+            raise type(error)(f"{where}: {error}") from error
+        built.append(block)
+
+        if widget_handlers:
+            block.set_mouse_handlers({MouseEvents[event_name]: resolved[name] for event_name, name in widget_handlers})
+        if widget_id is not None:
+            widgets[widget_id] = block
+
+        for i, child in enumerate(children):
+            self._build_widget(f'{where}.children[{i}]', child, block, resolved, widgets, built)
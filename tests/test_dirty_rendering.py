@@ -0,0 +1,91 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+
+
+class TestDirtyRendering(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+        self.text = gui.Text(self.window, dimensions=(50, 20), coordinates=(10, 10), text_value='a')
+        self.block = gui.Block(self.window, dimensions=(50, 20), coordinates=(100, 100))
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_first_draw_is_full(self):
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(0, 0, 200, 200)])
+
+    def test_idle_frame_is_empty(self):
+        self.window.draw_block()
+        self.assertEqual(self.window.draw_block(), [])
+
+    def test_set_text_damages_block_area(self):
+        self.window.draw_block()
+        self.text.set_text('b')
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(10, 10, 50, 20)])
+
+        self.text.set_text('b')
+        self.assertEqual(self.window.draw_block(), [])
+
+    def test_colour_change_damages_block_area(self):
+        self.window.draw_block()
+        self.block.colour = (1, 2, 3)
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(100, 100, 50, 20)])
+        self.assertEqual(self.window.surface.get_at((110, 110))[:3], (1, 2, 3))
+
+    def test_move_damages_old_and_new_area(self):
+        self.window.draw_block()
+        self.block.move(del_x=20)
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(100, 100, 70, 20)])
+        self.assertEqual(self.block.coordinates, (120, 100))
+
+    def test_child_add_and_remove(self):
+        self.window.draw_block()
+        child = gui.Block(self.window, dimensions=(10, 10), coordinates=(0, 150))
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(0, 150, 10, 10)])
+
+        child.__delitem__()
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(0, 150, 10, 10)])
+
+    def test_nested_change_damages_absolute_area(self):
+        inner = gui.Text(self.block, dimensions=(10, 10), coordinates=(5, 5))
+        self.window.draw_block()
+        inner.set_text('x')
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(105, 105, 10, 10)])
+
+    def test_clean_subtree_is_a_single_blit(self):
+        panel = gui.Block(self.window, dimensions=(100, 50), coordinates=(0, 100),
+                          polygon=('black', [(0, 0), (10, 0), (0, 10)]))
+        labels = [gui.Text(panel, dimensions=(40, 20), coordinates=(i * 50, 0), text_value=str(i)) for i in range(2)]
+        self.window.draw_block()
+
+        calls = []
+        panel._render = lambda area: calls.append(area)
+        for label in labels:
+            label.draw_block = lambda label=label: calls.append(label)
+
+        self.window.invalidate()
+        self.window.draw_block()
+        self.assertEqual(calls, [])
+        self.assertEqual(self.window.surface.get_at((1, 101))[:3], (0, 0, 0))
+
+    def test_dirty_descendant_redraws_only_its_area(self):
+        panel = gui.Block(self.window, dimensions=(100, 50), coordinates=(0, 100))
+        labels = [gui.Text(panel, dimensions=(40, 20), coordinates=(i * 50, 0), text_value=str(i)) for i in range(2)]
+        self.window.draw_block()
+
+        drawn = []
+        labels[0].draw_block = lambda: drawn.append(labels[0])
+        labels[1].set_text('x')
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(50, 100, 40, 20)])
+        self.assertEqual(drawn, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
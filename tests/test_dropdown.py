@@ -0,0 +1,126 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components.prefix_index import PrefixIndex
+
+
+def click(window, pos, button=pygame.BUTTON_LEFT):
+    window.mouse_event_handler(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button))
+    window.mouse_event_handler(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button))
+
+
+class TestPrefixIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = PrefixIndex(['banana', 'apple', 'cherry', 'apricot', 'app'])
+
+    def test_sorted(self):
+        self.assertEqual(self.index.options, ['app', 'apple', 'apricot', 'banana', 'cherry'])
+
+    def test_prefix_range(self):
+        self.assertEqual(self.index.prefix_range('ap'), (0, 3))
+        self.assertEqual(self.index.prefix_range('app'), (0, 2))
+        self.assertEqual(self.index.prefix_range('appl'), (1, 2))
+        self.assertEqual(self.index.prefix_range('b'), (3, 4))
+        self.assertEqual(self.index.prefix_range(''), (0, 5))
+
+    def test_no_match(self):
+        self.assertIsNone(self.index.first_match('apz'))
+        self.assertIsNone(self.index.first_match('d'))
+        self.assertEqual(self.index.first_match('c'), 4)
+
+    def test_add_and_remove(self):
+        self.index.prefix_range('b')
+        self.index.add('blueberry')
+        self.assertEqual(self.index.prefix_range('b'), (3, 5))
+
+        self.index.remove('apple')
+        self.assertEqual(self.index.prefix_range('app'), (0, 1))
+        with self.assertRaises(ValueError):
+            self.index.remove('apple')
+
+
+class TestDropdown(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(400, 400))
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def _dropdown(self, n):
+        return gui.Dropdown(self.window, dimensions=(160, 40), coordinates=(10, 10),
+                            options_list=[f'{i:06d}' for i in range(n)])
+
+    def test_rows_do_not_depend_on_option_count(self):
+        for n in (50, 100000):
+            dropdown = self._dropdown(n)
+            click(self.window, (150, 20))
+            self.assertTrue(dropdown.active)
+            self.assertEqual(len(dropdown.rows), 9)
+            self.assertEqual(len(dropdown.dropdown.children), 10)
+            dropdown.__delitem__()
+
+    def test_short_list(self):
+        dropdown = self._dropdown(3)
+        click(self.window, (150, 20))
+        self.assertEqual([row.get_text() for row in dropdown.rows], ['000000', '000001', '000002'])
+
+    def test_scrolling_rebinds_rows(self):
+        dropdown = self._dropdown(100)
+        click(self.window, (150, 20))
+
+        dropdown.abs_scroll_list(9)
+        self.assertEqual(dropdown.scroll_amount, 90)
+        self.assertEqual(dropdown.rows[0].get_text(), '000002')
+        self.assertEqual(dropdown.rows[0].coordinates, (0, -10))
+
+        click(self.window, (50, 60), button=5)
+        self.assertEqual(dropdown.scroll_amount, 100)
+        self.assertEqual(dropdown.rows[0].coordinates, (0, -20))
+
+    def test_select_option(self):
+        dropdown = self._dropdown(100)
+        click(self.window, (150, 20))
+        dropdown.abs_scroll_list(8)
+
+        click(self.window, (50, 95))
+        self.assertFalse(dropdown.active)
+        self.assertEqual(dropdown.textbox.get_text(), '000003')
+        self.assertEqual(len(self.window.hit_index), 2)
+
+    def test_click_elsewhere_closes(self):
+        dropdown = self._dropdown(100)
+        click(self.window, (150, 20))
+        click(self.window, (390, 390))
+        self.assertFalse(dropdown.active)
+
+    def test_typing_scrolls_to_prefix(self):
+        dropdown = self._dropdown(1000)
+        self.window.focus.set_focus(dropdown.textbox)
+        for character in '0005':
+            self.window.keyboard_event_handler(
+                pygame.event.Event(pygame.KEYDOWN, key=0, mod=0, unicode=character))
+
+        self.assertTrue(dropdown.active)
+        self.assertEqual(dropdown.rows[0].get_text(), '000500')
+
+    def test_add_and_remove_options(self):
+        dropdown = self._dropdown(3)
+        click(self.window, (150, 20))
+
+        dropdown.add_option('0000015')
+        self.assertEqual(dropdown.options_list, ['000000', '000001', '0000015', '000002'])
+        self.assertEqual([row.get_text() for row in dropdown.rows][2], '0000015')
+
+        dropdown.remove_option('000000')
+        self.assertEqual(dropdown.rows[0].get_text(), '000001')
+        self.assertEqual(len(dropdown.rows), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
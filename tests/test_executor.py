@@ -0,0 +1,162 @@
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components.executor import TaskCancelled
+
+
+def count_up(steps, progress):
+    for i in range(1, steps + 1):
+        progress(i / steps)
+    return steps
+
+
+def square(n):
+    return n * n
+
+
+class TestExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+        self.block = gui.Block(self.window, dimensions=(50, 20), coordinates=(0, 0))
+
+    def tearDown(self) -> None:
+        self.window.executor.shutdown()
+        pygame.quit()
+
+    def wait_for(self, condition, timeout=10):
+        # Stands in for the GUI loop, applying callbacks until condition holds
+        deadline = time.monotonic() + timeout
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, 'timed out waiting for the task')
+            self.window.updates.drain()
+            time.sleep(0.001)
+
+    def test_callbacks_run_on_gui_thread(self):
+        threads = []
+        results = []
+        progress = []
+        task = self.block.submit(count_up, 100,
+                                 on_progress=lambda fraction: (progress.append(fraction),
+                                                               threads.append(threading.current_thread())),
+                                 on_done=lambda result: (results.append(result),
+                                                         threads.append(threading.current_thread())))
+        self.wait_for(lambda: task.done)
+
+        self.assertEqual(results, [100])
+        self.assertEqual(task.result, 100)
+        self.assertEqual(progress[-1], 1.0)
+        # Progress is coalesced, so far fewer callbacks than reports
+        self.assertLessEqual(len(progress), 101)
+        self.assertEqual(set(threads), {threading.main_thread()})
+
+    def test_builtins(self):
+        results = []
+        task = self.window.submit(max, 3, 7, on_done=results.append)
+        self.wait_for(lambda: task.done)
+        self.assertEqual(results, [7])
+
+    def test_settled_tasks_are_forgotten(self):
+        tasks = [self.block.submit(square, i) for i in range(100)]
+        self.wait_for(lambda: all(task.done for task in tasks))
+        self.assertEqual(self.window.executor._owned, {})
+
+        release = threading.Event()
+        running = self.block.submit(release.wait, 5)
+        running.cancel()
+        release.set()
+        self.assertEqual(self.window.executor._owned, {})
+
+        task = self.block.submit(square, 3, process=True)
+        task.cancel()
+        self.assertEqual(self.window.executor._process_tasks, {})
+        self.assertEqual(self.window.executor._owned, {})
+
+    def test_errors(self):
+        errors = []
+        task = self.window.submit(square, 'a', on_error=errors.append)
+        self.wait_for(lambda: task.done)
+        self.assertIsInstance(errors[0], TypeError)
+        self.assertIs(task.exception, errors[0])
+
+    def test_deleting_owner_cancels(self):
+        started = threading.Event()
+        release = threading.Event()
+        stopped = []
+
+        def work(progress):
+            started.set()
+            release.wait(5)
+            try:
+                progress(0.5)
+            except TaskCancelled:
+                stopped.append(True)
+                raise
+
+        results = []
+        task = self.block.submit(work, on_done=results.append, on_progress=results.append)
+        started.wait(5)
+        self.block.__delitem__()
+        release.set()
+        task.future.exception(5)
+
+        self.window.updates.drain()
+        self.assertTrue(task.cancelled)
+        self.assertEqual(stopped, [True])
+        self.assertEqual(results, [])
+        self.assertFalse(task.done)
+
+    def test_process_pool(self):
+        progress = []
+        task = self.window.submit(count_up, 10, process=True, on_progress=progress.append)
+        squared = self.window.submit(square, 12, process=True)
+        self.wait_for(lambda: task.done and squared.done)
+
+        self.assertEqual((task.result, squared.result), (10, 144))
+        self.assertEqual(progress[-1], 1.0)
+
+
+class TestProgressBar(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        pygame.display.set_mode((200, 200))
+        self.window = gui.Window(dimensions=(200, 200))
+        self.bar = gui.ProgressBar(self.window, dimensions=(100, 20), coordinates=(0, 0),
+                                   colour='white', bar_colour='black', font_colour='white')
+
+    def tearDown(self) -> None:
+        self.window.executor.shutdown()
+        pygame.quit()
+
+    def test_draws_value(self):
+        self.bar.value = 0.5
+        self.window.draw_block()
+        self.assertEqual(self.bar.get_text(), '50%')
+        self.assertEqual(self.bar.surface.get_at((1, 1))[:3], (0, 0, 0))
+        self.assertEqual(self.bar.surface.get_at((98, 1))[:3], (255, 255, 255))
+
+        self.bar.value = 2
+        self.assertEqual(self.bar.value, 1.0)
+
+    def test_bound_to_task(self):
+        task = self.window.submit(count_up, 20)
+        self.bar.bind(task)
+        deadline = time.monotonic() + 10
+        while not task.done:
+            self.assertLess(time.monotonic(), deadline)
+            self.window.updates.drain()
+            time.sleep(0.001)
+
+        self.assertEqual(self.bar.value, 1.0)
+        self.assertEqual(self.bar.get_text(), '100%')
+
+
+if __name__ == '__main__':
+    unittest.main()
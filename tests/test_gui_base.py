@@ -0,0 +1,155 @@
+import logging
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.gui_base import GUIBase
+
+
+class TestTimers(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(100, 100))
+        self.calls = []
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_no_timers(self):
+        self.assertIsNone(self.window.time_until_next_timer())
+
+    def test_one_shot_timer(self):
+        self.window.set_timer(lambda: self.calls.append(1), 10, repeat=False)
+        self.assertLessEqual(self.window.time_until_next_timer(), 10)
+
+        pygame.time.wait(15)
+        self.window.run_timers()
+        self.window.run_timers()
+        self.assertEqual(self.calls, [1])
+        self.assertIsNone(self.window.time_until_next_timer())
+
+    def test_repeating_timer_and_cancel(self):
+        timer = self.window.set_timer(lambda: self.calls.append(1), 5)
+        pygame.time.wait(10)
+        self.window.run_timers()
+        self.assertEqual(self.calls, [1])
+        self.assertIsNotNone(self.window.time_until_next_timer())
+
+        timer.cancel()
+        pygame.time.wait(10)
+        self.window.run_timers()
+        self.assertEqual(self.calls, [1])
+        self.assertIsNone(self.window.time_until_next_timer())
+
+    def test_idle(self):
+        self.window.draw_block()
+        self.assertTrue(self.window.is_idle())
+
+        block = gui.Block(self.window, dimensions=(10, 10), coordinates=(0, 0))
+        self.assertFalse(self.window.is_idle())
+        self.window.draw_block()
+
+        block.start_updates(block)
+        self.assertFalse(self.window.is_idle())
+
+
+class TestGUIBase(unittest.TestCase):
+    def _motion(self, pos, rel, buttons=(0, 0, 0)):
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=buttons)
+
+    def test_motion_is_merged(self):
+        gui_inst = GUIBase(dimensions=(100, 100))
+        button = gui.Button(gui_inst.window, dimensions=(10, 10), coordinates=(0, 0))
+        button.set_mouse_handlers({gui.MouseEvents.MOVE_MOUSE: lambda event: None})
+        gui_inst._update_allowed_events()
+
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(3, 3), button=1)
+        events = gui_inst._preprocess_events([
+            self._motion((1, 1), (1, 1)),
+            self._motion((2, 3), (1, 2), buttons=(1, 0, 0)),
+            click,
+            self._motion((3, 3), (1, 0)),
+            pygame.event.Event(pygame.WINDOWMOVED),
+        ])
+
+        self.assertEqual(len(events), 3)
+        self.assertEqual((events[0].pos, events[0].rel, events[0].buttons), ((2, 3), (2, 3), (1, 0, 0)))
+        self.assertIs(events[1], click)
+        self.assertEqual(gui_inst.event_stats, {'merged': 1, 'dropped': 1})
+
+    def test_allowed_events_follow_handlers(self):
+        gui_inst = GUIBase(dimensions=(100, 100))
+        gui_inst._update_allowed_events()
+        self.assertTrue(pygame.event.get_blocked(pygame.MOUSEBUTTONDOWN))
+        self.assertFalse(pygame.event.get_blocked(pygame.KEYDOWN))
+
+        button = gui.Button(gui_inst.window, dimensions=(10, 10), coordinates=(0, 0))
+        gui_inst._update_allowed_events()
+        self.assertFalse(pygame.event.get_blocked(pygame.MOUSEBUTTONDOWN))
+        self.assertTrue(pygame.event.get_blocked(pygame.MOUSEMOTION))
+
+        button.set_mouse_handlers({gui.MouseEvents.MOVE_MOUSE: lambda event: None})
+        gui_inst._update_allowed_events()
+        self.assertFalse(pygame.event.get_blocked(pygame.MOUSEMOTION))
+
+        button.__delitem__()
+        gui_inst._update_allowed_events()
+        self.assertTrue(pygame.event.get_blocked(pygame.MOUSEMOTION))
+
+    def test_idle_run_waits_for_timer(self):
+        gui_inst = GUIBase(dimensions=(100, 100))
+        frames = []
+        gui_inst.window.update = lambda: frames.append(1)
+        gui_inst.window.set_timer(gui_inst.quit_gui, 200, repeat=False)
+
+        start = time.perf_counter()
+        gui_inst.run()
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.15)
+        # An idle window only wakes up for events and timers, not every frame
+        self.assertLess(len(frames), 5)
+
+
+class TestStartup(unittest.TestCase):
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_widget_modules_load_lazily(self):
+        code = ('import sys, pygame_gui.components as gui;'
+                'print(sorted(m for m in sys.modules if m.endswith("_block") or m == "pyperclip"));'
+                'gui.Dropdown;'
+                'print("pygame_gui.components.textbox_block" in sys.modules, "pyperclip" in sys.modules)')
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.splitlines()[-2:], ['[]', 'True False'])
+
+    def test_only_needed_subsystems_are_started(self):
+        level = logging.getLogger().level
+        pygame.quit()
+
+        gui_inst = GUIBase(dimensions=(100, 100))
+        self.assertTrue(pygame.display.get_init())
+        self.assertTrue(pygame.font.get_init())
+        self.assertIsNone(pygame.mixer.get_init())
+        self.assertEqual(logging.getLogger().level, level)
+
+        gui_inst.window.set_timer(gui_inst.quit_gui, 20, repeat=False)
+        gui_inst.run()
+        self.assertIsNone(pygame.mixer.get_init())
+
+    def test_ticks_advance_after_init(self):
+        # In a fresh interpreter, so that nothing else (e.g. a Clock) has started SDL's timer
+        code = ('import time, pygame; from pygame_gui.gui_base import GUIBase;'
+                'GUIBase.init_pygame(); time.sleep(0.02); print(pygame.time.get_ticks() > 0)')
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.splitlines()[-1], 'True')
+
+
+if __name__ == '__main__':
+    unittest.main()
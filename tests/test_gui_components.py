@@ -1,43 +1,86 @@
+import os
 import unittest
 
-from pygame_gui.gui_base import (Block, Button, Dropdown, MyGUI, RootBlock, Slider, Text, TextBox)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
 
+import pygame
 
-class TestRootBlock(unittest.TestCase):
-    def setUp(self) -> None:
-        self.block = RootBlock()
+from pygame_gui.components import Block, Button, Dropdown, Slider, Text, TextBox, Window
+from pygame_gui.gui_base import GUIBase
 
 
-class TestBlock(unittest.TestCase):
+class ComponentTestCase(unittest.TestCase):
     def setUp(self) -> None:
-        self.block = Block()
+        pygame.init()
+        self.window = Window(dimensions=(400, 400))
 
+    def tearDown(self) -> None:
+        pygame.quit()
 
-class TestText(unittest.TestCase):
-    def setUp(self) -> None:
-        self.block = Text()
+    def assertDraws(self, block):
+        self.assertIn(block, self.window.children)
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(0, 0, 400, 400)])
 
 
-class TestButton(unittest.TestCase):
-    def setUp(self) -> None:
-        self.block = Button()
+class TestWindow(ComponentTestCase):
+    def test_draw(self):
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(0, 0, 400, 400)])
+        self.assertEqual(self.window.draw_block(), [])
 
 
-class TestTextBox(unittest.TestCase):
-    def setUp(self) -> None:
-        self.block = TextBox()
+class TestBlock(ComponentTestCase):
+    def test_draw(self):
+        self.assertDraws(Block(self.window, dimensions=(100, 40), coordinates=(10, 10)))
 
+    def test_tree_services_reach_the_root(self):
+        panel = Block(self.window, dimensions=(100, 40), coordinates=(10, 10))
+        block = Block(panel, dimensions=(10, 10), coordinates=(0, 0))
 
-class TestSlider(unittest.TestCase):
-    def setUp(self) -> None:
-        self.block = Slider()
+        block.capture_mouse(block)
+        self.assertIs(self.window.mouse_capture, block)
+        block.release_mouse(block)
+        block.request_layout(panel)
+        self.assertIn(panel, self.window._layout_queued)
+        block.layout()
+        block.refresh_hit_rects()
+        block.run_timers()
+        self.assertIsNone(block.time_until_next_timer())
+        self.assertEqual(block.consumed_mouse_event_types(), self.window.consumed_mouse_event_types())
+        self.window.draw_block()
+        self.assertTrue(block.is_idle())
 
 
-class TestDropdown(unittest.TestCase):
-    def setUp(self) -> None:
-        self.block = Dropdown()
+class TestText(ComponentTestCase):
+    def test_draw(self):
+        self.assertDraws(Text(self.window, dimensions=(100, 40), coordinates=(10, 10), text_value='Test'))
 
 
-class TestMyGUI(unittest.TestCase):
-    def setUp(self) -> None:
-        self.block = MyGUI()
+class TestButton(ComponentTestCase):
+    def test_draw(self):
+        self.assertDraws(Button(self.window, dimensions=(100, 40), coordinates=(10, 10), text_value='Test'))
+
+
+class TestTextBox(ComponentTestCase):
+    def test_draw(self):
+        self.assertDraws(TextBox(self.window, dimensions=(100, 40), coordinates=(10, 10)))
+
+
+class TestSlider(ComponentTestCase):
+    def test_draw(self):
+        self.assertDraws(Slider(self.window, dimensions=(10, 40), coordinates=(10, 10),
+                                move_limits=((10, 10), (10, 100)), dropdown=None))
+
+
+class TestDropdown(ComponentTestCase):
+    def test_draw(self):
+        self.assertDraws(Dropdown(self.window, dimensions=(160, 40), coordinates=(10, 10)))
+
+
+class TestGUIBase(unittest.TestCase):
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_init(self):
+        gui = GUIBase(dimensions=(400, 400))
+        self.assertFalse(gui.running)
+        self.assertEqual(gui.window.dimensions, (400, 400))
@@ -0,0 +1,109 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+
+
+def key_down(key, unicode='', mod=0):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=mod)
+
+
+class RecordingBlock(gui.Block):
+    focusable = True
+
+    def __init__(self, parent, handles=True, **kwargs):
+        super().__init__(parent, dimensions=(10, 10), coordinates=(0, 0), **kwargs)
+        self.handles = handles
+        self.received = []
+
+    def keyboard_event_handler(self, event):
+        self.received.append(event)
+        return self.handles
+
+
+class TestFocusManager(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+        self.focus = self.window.focus
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_only_focused_block_receives_events(self):
+        a = RecordingBlock(self.window)
+        b = RecordingBlock(self.window)
+        self.focus.set_focus(b)
+
+        self.assertTrue(self.window.keyboard_event_handler(key_down(pygame.K_a, 'a')))
+        self.assertEqual((len(a.received), len(b.received)), (0, 1))
+
+    def test_no_focus(self):
+        RecordingBlock(self.window)
+        self.assertFalse(self.window.keyboard_event_handler(key_down(pygame.K_a, 'a')))
+
+    def test_unhandled_events_bubble_up(self):
+        outer = RecordingBlock(self.window, handles=False)
+        inner = RecordingBlock(outer, handles=False)
+        self.focus.set_focus(inner)
+
+        self.assertFalse(self.window.keyboard_event_handler(key_down(pygame.K_a, 'a')))
+        self.assertEqual((len(inner.received), len(outer.received)), (1, 1))
+
+        outer.handles = True
+        self.assertTrue(self.window.keyboard_event_handler(key_down(pygame.K_a, 'a')))
+
+    def test_tab_order(self):
+        a = RecordingBlock(self.window)
+        container = gui.Block(self.window, dimensions=(10, 10), coordinates=(0, 0))
+        b = RecordingBlock(container)
+        c = RecordingBlock(self.window)
+
+        self.assertEqual(self.focus.focus_order(), [a, b, c])
+
+        self.window.keyboard_event_handler(key_down(pygame.K_TAB))
+        self.assertIs(self.focus.focused, a)
+        self.window.keyboard_event_handler(key_down(pygame.K_TAB))
+        self.assertIs(self.focus.focused, b)
+        self.window.keyboard_event_handler(key_down(pygame.K_TAB, mod=pygame.KMOD_LSHIFT))
+        self.window.keyboard_event_handler(key_down(pygame.K_TAB, mod=pygame.KMOD_LSHIFT))
+        self.assertIs(self.focus.focused, c)
+        self.assertEqual(a.received + b.received + c.received, [])
+
+    def test_deleted_block_loses_focus(self):
+        a = RecordingBlock(self.window)
+        self.focus.set_focus(a)
+        a.__delitem__()
+        self.assertIsNone(self.focus.focused)
+
+
+class TestTextBoxFocus(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+        self.a = gui.TextBox(self.window, dimensions=(100, 40), coordinates=(0, 0))
+        self.b = gui.TextBox(self.window, dimensions=(100, 40), coordinates=(0, 50))
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_typing_goes_to_focused_textbox(self):
+        self.window.keyboard_event_handler(key_down(pygame.K_TAB))
+        self.window.keyboard_event_handler(key_down(pygame.K_TAB))
+        self.window.keyboard_event_handler(key_down(pygame.K_x, 'x'))
+
+        self.assertEqual((self.a.get_text(), self.b.get_text()), ('', 'x'))
+        self.assertEqual((self.a.active, self.b.active), (False, True))
+
+    def test_escape_is_not_handled(self):
+        self.window.focus.set_focus(self.a)
+        self.assertFalse(self.window.keyboard_event_handler(key_down(pygame.K_ESCAPE, '\x1b')))
+        self.assertEqual(self.a.get_text(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components import Alignment
+from pygame_gui.gui_base import GUIBase
+
+
+class TestLayout(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 100))
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_alignment_at_construction(self):
+        block = gui.Block(self.window, dimensions=(20, 10), align_x=Alignment.RIGHT, align_y=Alignment.CENTRE,
+                          margin_x=5)
+        self.assertEqual(block.coordinates, (175, 45))
+
+    def test_alignment_follows_resize(self):
+        right = gui.Block(self.window, dimensions=(20, 10), align_x=Alignment.RIGHT, coord_y=5, margin_x=5)
+        centre = gui.Block(self.window, dimensions=(20, 10), alignment=Alignment.CENTRE)
+        fixed = gui.Block(self.window, dimensions=(20, 10), coordinates=(5, 5))
+        self.window.draw_block()
+
+        self.window.resize((300, 200))
+        self.window.layout()
+        self.assertEqual(right.coordinates, (275, 5))
+        self.assertEqual(centre.coordinates, (140, 95))
+        self.assertEqual(fixed.coordinates, (5, 5))
+        self.assertEqual(self.window.draw_block(), [pygame.Rect(0, 0, 300, 200)])
+
+    def test_own_resize_replaces_block(self):
+        right = gui.Block(self.window, dimensions=(20, 10), align_x=Alignment.RIGHT, coord_y=0)
+        centre = gui.Block(self.window, dimensions=(20, 10), alignment=Alignment.CENTRE)
+        left = gui.Block(self.window, dimensions=(20, 10), coordinates=(5, 5))
+
+        right.resize((50, 10))
+        centre.resize((50, 50))
+        left.resize((50, 50))
+        self.assertEqual(right.coordinates, (150, 0))
+        self.assertEqual(centre.coordinates, (75, 25))
+        self.assertEqual(left.coordinates, (5, 5))
+
+    def test_only_dependent_blocks_are_visited(self):
+        fixed = [gui.Block(self.window, dimensions=(5, 5), coordinates=(i, i)) for i in range(50)]
+        right = gui.Block(self.window, dimensions=(20, 10), align_x=Alignment.RIGHT, coord_y=5)
+
+        visited = []
+        for block in fixed + [right]:
+            block._layout_geometry = (lambda block=block, original=block._layout_geometry:
+                                      visited.append(block) or original())
+
+        self.window.resize((300, 200))
+        self.window.layout()
+        self.assertEqual(visited, [right])
+
+    def test_anchors_stretch(self):
+        header = gui.Block(self.window, dimensions=(0, 20), align_x=Alignment.LEFT | Alignment.RIGHT, coord_y=0,
+                           margin_x=10)
+        self.assertEqual((header.coordinates, header.dimensions), ((10, 0), (180, 20)))
+
+        self.window.resize((400, 100))
+        self.window.layout()
+        self.assertEqual((header.coordinates, header.dimensions), ((10, 0), (380, 20)))
+
+    def test_nested_relayout_in_one_pass(self):
+        panel = gui.Block(self.window, dimensions=(0, 0), align_x=Alignment.LEFT | Alignment.RIGHT,
+                          align_y=Alignment.TOP | Alignment.BOTTOM)
+        button = gui.Button(panel, dimensions=(20, 10), align_x=Alignment.RIGHT, align_y=Alignment.BOTTOM)
+        self.assertEqual(panel.dimensions, (200, 100))
+        self.assertEqual(button.coordinates, (180, 90))
+
+        self.window.resize((300, 150))
+        self.window.layout()
+        self.assertEqual(panel.dimensions, (300, 150))
+        self.assertEqual(button.coordinates, (280, 140))
+
+        # The hit rect follows the button
+        events = []
+        button.set_mouse_handlers({gui.MouseEvents.LEFT_MOUSE_DOWN: events.append})
+        self.window.mouse_event_handler(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(285, 145), button=1))
+        self.assertEqual(len(events), 1)
+
+    def test_stacking(self):
+        column = gui.Block(self.window, dimensions=(50, 100), coordinates=(0, 0), stack='column', spacing=5)
+        rows = [gui.Block(column, dimensions=(50, 10 + i), coord_x=0) for i in range(3)]
+        self.assertEqual([row.coordinates for row in rows], [(0, 0), (0, 15), (0, 31)])
+
+        rows[0].resize((50, 20))
+        self.window.layout()
+        self.assertEqual([row.coordinates for row in rows], [(0, 0), (0, 25), (0, 41)])
+
+        rows[1].__delitem__()
+        self.window.layout()
+        self.assertEqual([row.coordinates for row in (rows[0], rows[2])], [(0, 0), (0, 25)])
+
+        first = gui.Block(column, dimensions=(50, 5), coord_x=0, priority=-1)
+        self.window.layout()
+        self.assertEqual([row.coordinates for row in (first, rows[0], rows[2])], [(0, 0), (0, 10), (0, 35)])
+
+    def test_row_with_cross_axis_alignment(self):
+        row = gui.Block(self.window, dimensions=(200, 40), coordinates=(0, 0), stack='row')
+        items = [gui.Block(row, dimensions=(30, 10), align_y=Alignment.CENTRE) for _ in range(2)]
+        self.assertEqual([item.coordinates for item in items], [(0, 15), (30, 15)])
+
+        row.resize((200, 60))
+        self.window.layout()
+        self.assertEqual([item.coordinates for item in items], [(0, 25), (30, 25)])
+
+    def test_under_constrained(self):
+        with self.assertRaises(ValueError):
+            gui.Block(self.window, dimensions=(10, 10), coord_x=0)
+
+
+class TestGUIResize(unittest.TestCase):
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_resize_event(self):
+        gui_inst = GUIBase(dimensions=(200, 100), resizable=True)
+        block = gui.Block(gui_inst.window, dimensions=(20, 10), align_x=Alignment.RIGHT, coord_y=0)
+
+        gui_inst._update_allowed_events()
+        pygame.event.post(pygame.event.Event(pygame.VIDEORESIZE, size=(300, 100), w=300, h=100))
+        gui_inst.window.set_timer(gui_inst.quit_gui, 50, repeat=False)
+        gui_inst.run()
+
+        self.assertEqual(gui_inst.window.dimensions, (300, 100))
+        self.assertEqual(block.coordinates, (280, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui import layout_loader
+from pygame_gui.components import Alignment
+from pygame_gui.layout_loader import LayoutLoader
+
+LAYOUT = {'widgets': [
+    {'type': 'Block', 'id': 'panel', 'dimensions': [200, 100], 'coordinates': [10, 10], 'stack': 'column',
+     'colour': 'offwhite', 'children': [
+        {'type': 'Text', 'id': 'title', 'dimensions': [200, 40], 'coord_x': 0, 'text_value': 'Title',
+         'text_alignment': 'left'},
+        {'type': 'Button', 'id': 'ok', 'dimensions': [200, 40], 'coord_x': 0, 'text_value': 'OK',
+         'handlers': {'LEFT_MOUSE_DOWN': 'on_ok'}},
+     ]},
+    {'type': 'Block', 'dimensions': [50, 20], 'align_x': 'right', 'coord_y': 0, 'colour': [1, 2, 3]},
+]}
+
+TOML_LAYOUT = '''
+[[widgets]]
+type = "Block"
+id = "header"
+dimensions = [0, 30]
+align_x = "left|right"
+coord_y = 0
+
+[[widgets.children]]
+type = "TextBox"
+id = "name"
+dimensions = [100, 30]
+coordinates = [0, 0]
+'''
+
+
+class TestLayoutLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(400, 300))
+        self.directory = tempfile.TemporaryDirectory()
+        self.clicks = []
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        pygame.quit()
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as f:
+            f.write(content if isinstance(content, str) else json.dumps(content))
+        return path
+
+    def on_ok(self, event):
+        self.clicks.append(event.pos)
+
+    def test_json(self):
+        widgets = LayoutLoader().load(self._write('layout.json', LAYOUT), self.window, handlers=self)
+
+        self.assertEqual(set(widgets), {'panel', 'title', 'ok'})
+        self.assertEqual(widgets['ok'].coordinates, (0, 40))
+        self.assertEqual(widgets['title'].text_alignment, Alignment.LEFT)
+        self.assertEqual(self.window.children[1].coordinates, (350, 0))
+        self.assertEqual(self.window.children[1].colour, (1, 2, 3))
+
+        self.window.mouse_event_handler(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(20, 60), button=1))
+        self.assertEqual(self.clicks, [(20, 60)])
+
+    def test_toml(self):
+        widgets = LayoutLoader().load(self._write('layout.toml', TOML_LAYOUT), self.window)
+        self.assertEqual(widgets['header'].dimensions, (400, 30))
+        self.assertIsInstance(widgets['name'], gui.TextBox)
+
+    def test_handlers_mapping(self):
+        widgets = LayoutLoader().load(self._write('layout.json', LAYOUT), self.window, handlers={'on_ok': self.on_ok})
+        self.assertIn('ok', widgets)
+
+    def test_invalid_layouts_build_nothing(self):
+        invalid = [
+            {'widgets': [{'type': 'Window'}]},
+            {'widgets': [{'type': 'Block', 'dimensions': [1, 1], 'coordinates': [0, 0], 'colur': 'white'}]},
+            {'widgets': [{'type': 'Block', 'dimensions': [1, 1], 'align_x': 'middle', 'coord_y': 0}]},
+            {'widgets': [{'type': 'Block', 'id': 'a', 'dimensions': [1, 1], 'coordinates': [0, 0]},
+                         {'type': 'Block', 'id': 'a', 'dimensions': [1, 1], 'coordinates': [0, 0]}]},
+            {'widgets': [{'type': 'Block', 'dimensions': [1, 1], 'coordinates': [0, 0],
+                          'handlers': {'LEFT_MOUSE_UP': 'on_ok'}}]},
+            {'widgets': [{'type': 'Button', 'dimensions': [1, 1], 'coordinates': [0, 0],
+                          'handlers': {'DOUBLE_CLICK': 'on_ok'}}]},
+            {'blocks': []},
+            {'widgets': [{'type': 'Block', 'coordinates': [0, 0]}]},
+            {'widgets': [{'type': 'Block', 'dimensions': [1, 1], 'coordinates': [0, 0], 'align_x': 'left'}]},
+            {'widgets': [{'type': 'Block', 'dimensions': [1, 1], 'coordinates': [0, 0], 'stack': 'grid'}]},
+        ]
+        for i, layout in enumerate(invalid):
+            with self.subTest(layout=layout), self.assertRaises(ValueError):
+                LayoutLoader().load(self._write(f'{i}.json', layout), self.window, handlers=self)
+
+        with self.assertRaises(ValueError):
+            LayoutLoader().load(self._write('layout.json', LAYOUT), self.window, handlers={})
+        self.assertEqual(len(self.window.children), 0)
+
+    def test_constraints_checked_with_path(self):
+        layout = {'widgets': [{'type': 'Block', 'dimensions': [100, 100], 'coordinates': [0, 0], 'stack': 'row',
+                               'children': [{'type': 'Block', 'dimensions': [10, 10]}]}]}
+        with self.assertRaisesRegex(ValueError, r'widgets\[0\]\.children\[0\]: the y position has been under'):
+            layout_loader.compile_layout(layout)
+
+    def test_failed_build_leaves_parent_unchanged(self):
+        # Top level positions depend on the parent, so are only checked as they're built
+        layout = {'widgets': [LAYOUT['widgets'][0], {'type': 'Block', 'dimensions': [10, 10], 'coord_x': 0}]}
+        path = self._write('layout.json', layout)
+        with self.assertRaisesRegex(ValueError, r'^widgets\[1\]: The y position has been under-constrained'):
+            LayoutLoader().load(path, self.window, handlers=self)
+        self.assertEqual(len(self.window.children), 0)
+
+    def test_compiled_layout_is_reused(self):
+        path = self._write('layout.json', LAYOUT)
+        loader = LayoutLoader()
+        compiled = loader.compile(path)
+        self.assertIs(loader.compile(path), compiled)
+
+        # A changed file is compiled again
+        changed = {'widgets': LAYOUT['widgets'][:1]}
+        self._write('layout.json', changed)
+        os.utime(path, ns=(0, 0))
+        self.assertEqual(len(loader.compile(path)), 1)
+
+    def test_cache_dir(self):
+        path = self._write('layout.json', LAYOUT)
+        cache_dir = os.path.join(self.directory.name, 'cache')
+        compiled = LayoutLoader(cache_dir=cache_dir).compile(path)
+
+        with mock.patch.object(layout_loader, 'compile_layout') as compile_layout:
+            self.assertEqual(LayoutLoader(cache_dir=cache_dir).compile(path), compiled)
+        compile_layout.assert_not_called()
+
+        # An edit which leaves the modification time and size as they were isn't missed
+        stat = os.stat(path)
+        changed = json.dumps(LAYOUT).replace('Title', 'Other')
+        self._write('layout.json', changed)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertNotEqual(LayoutLoader(cache_dir=cache_dir).compile(path), compiled)
+
+
+if __name__ == '__main__':
+    unittest.main()
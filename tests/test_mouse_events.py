@@ -0,0 +1,169 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components import MouseEvents
+from pygame_gui.components.spatial_index import SpatialIndex
+
+
+def mouse_down(pos, button=pygame.BUTTON_LEFT):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)
+
+
+def mouse_up(pos, button=pygame.BUTTON_LEFT):
+    return pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button)
+
+
+def mouse_motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = SpatialIndex(cell_size=10)
+
+    def test_query_point(self):
+        self.index.insert('a', pygame.Rect(0, 0, 25, 25))
+        self.index.insert('b', pygame.Rect(20, 20, 10, 10))
+
+        self.assertEqual(self.index.query_point((5, 5)), ['a'])
+        self.assertCountEqual(self.index.query_point((22, 22)), ['a', 'b'])
+        self.assertEqual(self.index.query_point((27, 27)), ['b'])
+        self.assertEqual(self.index.query_point((50, 50)), [])
+
+    def test_update_and_remove(self):
+        self.index.insert('a', pygame.Rect(0, 0, 10, 10))
+        self.index.insert('a', pygame.Rect(40, 40, 10, 10))
+        self.assertEqual(self.index.query_point((5, 5)), [])
+        self.assertEqual(self.index.query_point((45, 45)), ['a'])
+
+        self.index.remove('a')
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.query_point((45, 45)), [])
+
+    def test_empty_rect(self):
+        self.index.insert('a', pygame.Rect(0, 0, 0, 10))
+        self.assertIn('a', self.index)
+        self.assertEqual(self.index.query_point((0, 0)), [])
+
+
+class TestMouseDispatch(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+        self.events = []
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def _button(self, name, parent=None, **kwargs):
+        button = gui.Button(parent or self.window, dimensions=(50, 50), **kwargs)
+        button.set_mouse_handlers({
+            MouseEvents.LEFT_MOUSE_DOWN: lambda event: self.events.append((name, 'down')),
+            MouseEvents.LEFT_MOUSE_UP: lambda event: self.events.append((name, 'up')),
+        })
+        return button
+
+    def test_only_blocks_under_pointer_receive_events(self):
+        self._button('a', coordinates=(0, 0))
+        self._button('b', coordinates=(100, 100))
+
+        self.window.mouse_event_handler(mouse_down((10, 10)))
+        self.assertEqual(self.events, [('a', 'down')])
+
+    def test_topmost_block_is_first(self):
+        self._button('low', coordinates=(0, 0))
+        self._button('high', coordinates=(25, 25), priority=1)
+
+        self.window.mouse_event_handler(mouse_down((30, 30)))
+        self.assertEqual(self.events, [('high', 'down'), ('low', 'down')])
+
+    def test_held_button_captures_pointer(self):
+        button = self._button('a', coordinates=(0, 0))
+
+        self.window.mouse_event_handler(mouse_down((10, 10)))
+        self.assertTrue(button.held)
+        self.assertIs(self.window.mouse_capture, button)
+
+        self.window.mouse_event_handler(mouse_up((150, 150)))
+        self.assertFalse(button.held)
+        self.assertIsNone(self.window.mouse_capture)
+        self.assertEqual(self.events, [('a', 'down'), ('a', 'up')])
+
+    def test_index_follows_moves(self):
+        container = gui.Block(self.window, dimensions=(100, 100), coordinates=(0, 0))
+        self._button('a', parent=container, coordinates=(10, 10))
+
+        container.move(x=100, y=100)
+        self.window.mouse_event_handler(mouse_down((20, 20)))
+        self.window.mouse_event_handler(mouse_down((120, 120)))
+        self.assertEqual(self.events, [('a', 'down')])
+
+    def test_moves_are_applied_lazily(self):
+        container = gui.Block(self.window, dimensions=(100, 100), coordinates=(0, 0))
+        inner = gui.Block(container, dimensions=(60, 60), coordinates=(10, 10))
+        button = self._button('a', parent=inner, coordinates=(5, 5))
+
+        updates = []
+        button._update_hit_rects = lambda: updates.append(button)
+        for i in range(5):
+            container.move(del_x=10)
+        self.assertEqual(updates, [])
+        self.assertEqual(button.absolute_coordinates(), (65, 15))
+
+        del button._update_hit_rects
+        self.window.mouse_event_handler(mouse_down((70, 20)))
+        self.assertEqual(self.events, [('a', 'down')])
+
+    def test_deleted_before_refresh(self):
+        container = gui.Block(self.window, dimensions=(100, 100), coordinates=(0, 0))
+        self._button('a', parent=container, coordinates=(10, 10))
+
+        container.move(x=100, y=100)
+        container.__delitem__()
+        self.window.mouse_event_handler(mouse_down((120, 120)))
+        self.assertEqual(self.events, [])
+        self.assertEqual(len(self.window.hit_index), 0)
+
+    def test_clipped_by_parent(self):
+        container = gui.Block(self.window, dimensions=(50, 50), coordinates=(0, 0))
+        self._button('a', parent=container, coordinates=(40, 0))
+
+        self.window.mouse_event_handler(mouse_down((60, 10)))
+        self.assertEqual(self.events, [])
+
+    def test_deleted_button_is_removed(self):
+        button = self._button('a', coordinates=(0, 0))
+        button.__delitem__()
+
+        self.window.mouse_event_handler(mouse_down((10, 10)))
+        self.assertEqual(self.events, [])
+        self.assertEqual(len(self.window.hit_index), 0)
+
+    def test_unknown_and_unhandled_events_are_ignored(self):
+        button = self._button('a', coordinates=(0, 0))
+
+        with self.assertNoLogs(level='ERROR'):
+            self.window.mouse_event_handler(mouse_down((10, 10), button=8))
+            self.window.mouse_event_handler(mouse_down((10, 10), button=pygame.BUTTON_RIGHT))
+        self.assertEqual(self.events, [])
+        self.assertNotIn(MouseEvents.RIGHT_MOUSE_DOWN, button.event_function_dict)
+
+    def test_active_textbox_is_deselected_by_click_elsewhere(self):
+        textbox = gui.TextBox(self.window, dimensions=(100, 40), coordinates=(0, 0))
+
+        self.window.mouse_event_handler(mouse_down((10, 10)))
+        self.window.mouse_event_handler(mouse_up((10, 10)))
+        self.assertTrue(textbox.active)
+
+        self.window.mouse_event_handler(mouse_motion((150, 150)))
+        self.window.mouse_event_handler(mouse_down((150, 150)))
+        self.assertFalse(textbox.active)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components.profiler import RollingStats
+from pygame_gui.gui_base import GUIBase
+
+
+class TestRollingStats(unittest.TestCase):
+    def test_percentiles(self):
+        stats = RollingStats()
+        for i in range(1, 101):
+            stats.record(i)
+        summary = stats.summary()
+        self.assertEqual((summary['p50'], summary['p95'], summary['p99'], summary['max']), (51, 96, 100, 100))
+        self.assertEqual(summary['mean'], 50.5)
+
+    def test_window(self):
+        stats = RollingStats(window=10)
+        for i in range(100):
+            stats.record(i)
+        self.assertEqual(len(stats), 10)
+        self.assertEqual(stats.count, 100)
+        self.assertEqual(stats.percentile(0), 90)
+
+    def test_empty(self):
+        self.assertEqual(RollingStats().summary()['p99'], 0.0)
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+        self.profiler = self.window.profiler
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_disabled_records_nothing(self):
+        button = gui.Button(self.window, dimensions=(50, 50), coordinates=(0, 0))
+        self.profiler.begin_frame()
+        self.window.draw_block()
+        self.window.mouse_event_handler(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(5, 5), button=1))
+        self.profiler.mark('draw')
+        self.profiler.end_frame()
+
+        self.assertEqual(self.profiler.phase_stats(), {})
+        self.assertEqual(self.profiler.block_stats('draw'), [])
+        self.assertEqual(self.profiler.block_stats('mouse'), [])
+        self.assertTrue(button.held)
+
+    def test_phases(self):
+        self.profiler.enable()
+        for _ in range(3):
+            self.profiler.begin_frame()
+            self.profiler.mark('events')
+            self.profiler.mark('draw')
+            self.profiler.end_frame()
+
+        stats = self.profiler.phase_stats()
+        self.assertEqual(set(stats), {'events', 'draw', 'frame'})
+        self.assertEqual(stats['frame']['count'], 3)
+
+    def test_blocks(self):
+        self.profiler.enable()
+        panel = gui.Block(self.window, dimensions=(100, 100), coordinates=(0, 0))
+        text = gui.Text(panel, dimensions=(50, 20), coordinates=(0, 0), text_value='Test')
+        button = gui.Button(self.window, dimensions=(50, 50), coordinates=(120, 0))
+        textbox = gui.TextBox(self.window, dimensions=(50, 20), coordinates=(0, 120))
+        self.window.draw_block()
+
+        self.assertEqual({block for block, _ in self.profiler.block_stats('draw')}, {panel, text, button, textbox})
+
+        self.window.mouse_event_handler(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(130, 5), button=1))
+        self.assertEqual([block for block, _ in self.profiler.block_stats('mouse')], [button])
+
+        self.window.focus.set_focus(textbox)
+        self.window.keyboard_event_handler(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode='a'))
+        self.assertEqual([block for block, _ in self.profiler.block_stats('keyboard')], [textbox])
+
+        report = self.profiler.report()
+        self.assertEqual(report['blocks']['mouse'][0]['block'], 'Button at (120, 0)')
+
+
+class TestProfilerOverlay(unittest.TestCase):
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_overlay_shows_run_phases(self):
+        gui_inst = GUIBase(dimensions=(300, 300))
+        overlay = gui.ProfilerOverlay(gui_inst.window, coordinates=(0, 0), interval=20)
+        self.assertTrue(gui_inst.window.profiler.enabled)
+
+        gui_inst.window.set_timer(gui_inst.quit_gui, 100, repeat=False)
+        gui_inst.run()
+
+        stats = gui_inst.window.profiler.phase_stats()
+        for phase in gui.ProfilerOverlay.phases:
+            self.assertIn(phase, stats)
+        self.assertTrue(overlay.lines[1].get_text().startswith('frame'))
+        self.assertNotIn('-', overlay.lines[1].get_text())
+
+    def test_enabled_mid_frame(self):
+        gui_inst = GUIBase(dimensions=(300, 300))
+        profiler = gui_inst.window.profiler
+        gui_inst.window.set_timer(profiler.enable, 0, repeat=False)
+
+        # The frame the profiler is enabled in isn't recorded, the next one is
+        gui_inst._run_frame([])
+        self.assertTrue(profiler.enabled)
+        self.assertEqual(profiler.phase_stats(), {})
+
+        gui_inst._run_frame([])
+        self.assertEqual(profiler.phase_stats()['frame']['count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
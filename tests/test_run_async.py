@@ -0,0 +1,109 @@
+import asyncio
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components import MouseEvents
+from pygame_gui.gui_base import GUIBase
+
+
+class TestRunAsync(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gui = GUIBase(dimensions=(200, 200))
+        self.window = self.gui.window
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def _post_later(self, event, delay=20):
+        self.window.set_timer(lambda: pygame.event.post(event), delay, repeat=False)
+
+    def test_coroutine_handler(self):
+        button = gui.Button(self.window, dimensions=(50, 50), coordinates=(0, 0), text_value='idle')
+        frames = []
+        self.window.start_updates(button)
+        button.update = lambda: frames.append(1)
+
+        async def load(event):
+            button.set_text('loading')
+            frames.clear()
+            await asyncio.sleep(0.1)
+            button.set_text('loaded')
+
+        button.set_mouse_handlers({MouseEvents.LEFT_MOUSE_DOWN: load})
+        self._post_later(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 10), button=1))
+        self.window.set_timer(self.gui.quit_gui, 250, repeat=False)
+        asyncio.run(self.gui.run_async())
+
+        self.assertEqual(button.get_text(), 'loaded')
+        # Frames kept being drawn while the handler was waiting
+        self.assertGreater(len(frames), 3)
+
+    def test_runs_alongside_other_tasks(self):
+        ticks = []
+
+        async def telemetry():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            task = asyncio.create_task(telemetry())
+            self.window.set_timer(self.gui.quit_gui, 100, repeat=False)
+            await self.gui.run_async()
+            task.cancel()
+
+        asyncio.run(main())
+        self.assertGreater(len(ticks), 5)
+
+    def test_results_come_back_between_frames(self):
+        results = []
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return 42
+
+        self.window.set_timer(lambda: self.window.run_coroutine(fetch(), on_done=results.append), 10, repeat=False)
+        self.window.set_timer(self.gui.quit_gui, 100, repeat=False)
+        asyncio.run(self.gui.run_async())
+        self.assertEqual(results, [42])
+
+    def test_async_timer_and_cancel_on_quit(self):
+        events = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                events.append('cancelled')
+                raise
+
+        self.window.set_timer(slow, 10, repeat=False)
+        self.window.set_timer(self.gui.quit_gui, 50, repeat=False)
+        asyncio.run(self.gui.run_async())
+        self.assertEqual(events, ['cancelled'])
+        self.assertEqual(self.window._tasks, set())
+
+    def test_coroutine_needs_run_async(self):
+        async def handler():
+            pass
+
+        with self.assertRaises(RuntimeError):
+            self.window.run_coroutine(handler())
+
+    def test_exceptions_are_logged(self):
+        async def broken():
+            raise ValueError('broken')
+
+        self.window.set_timer(broken, 10, repeat=False)
+        self.window.set_timer(self.gui.quit_gui, 50, repeat=False)
+        with self.assertLogs('pygame_gui', level='ERROR'):
+            asyncio.run(self.gui.run_async())
+
+
+if __name__ == '__main__':
+    unittest.main()
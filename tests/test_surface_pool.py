@@ -0,0 +1,107 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components.surface_pool import SurfacePool
+
+
+def click(window, pos):
+    window.mouse_event_handler(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=pygame.BUTTON_LEFT))
+    window.mouse_event_handler(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=pygame.BUTTON_LEFT))
+
+
+class TestSurfacePool(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        pygame.display.set_mode((100, 100))
+        self.pool = SurfacePool(max_bytes=3 * 10 * 10 * 4)
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_reuse_by_size(self):
+        surface = self.pool.acquire((10, 10))
+        self.pool.release(surface)
+        self.assertIsNot(self.pool.acquire((10, 20)), surface)
+        self.assertIs(self.pool.acquire((10, 10)), surface)
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 2))
+        self.assertEqual(len(self.pool), 0)
+
+    def test_eviction(self):
+        surfaces = [self.pool.acquire((10, 10)) for _ in range(4)]
+        for surface in surfaces:
+            self.pool.release(surface)
+
+        # The least recently released surface is freed
+        self.assertEqual(len(self.pool), 3)
+        self.assertEqual(self.pool.evictions, 1)
+        self.assertEqual(self.pool.pooled_bytes, 3 * 10 * 10 * 4)
+        self.assertNotIn(surfaces[0], [self.pool.acquire((10, 10)) for _ in range(3)])
+
+        self.pool.release(surfaces[1])
+        self.pool.max_bytes = 0
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(self.pool.pooled_bytes, 0)
+
+    def test_cleared_on_quit(self):
+        self.pool.release(self.pool.acquire((10, 10)))
+        pygame.quit()
+        self.assertEqual(len(self.pool), 0)
+
+    def test_cleared_on_every_quit(self):
+        for _ in range(3):
+            pygame.init()
+            pygame.display.set_mode((100, 100))
+            self.pool.release(self.pool.acquire((10, 10)))
+            self.assertEqual(len(self.pool), 1)
+            pygame.quit()
+            self.assertEqual(len(self.pool), 0)
+            self.assertEqual((self.pool.hits, self.pool.misses, self.pool.evictions), (0, 0, 0))
+
+
+class TestBlockSurfaces(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(400, 400))
+        self.window.draw_block()
+        self.pool = gui.Block.surface_pool
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_deleted_block_surface_is_reused(self):
+        block = gui.Block(self.window, dimensions=(33, 17), coordinates=(0, 0))
+        self.window.draw_block()
+        surface = block.surface
+
+        block.__delitem__()
+        self.assertIsNone(block.surface)
+
+        block = gui.Block(self.window, dimensions=(33, 17), coordinates=(50, 50), colour=(1, 2, 3))
+        self.window.draw_block()
+        self.assertIs(block.surface, surface)
+        self.assertEqual(self.window.surface.get_at((60, 60))[:3], (1, 2, 3))
+
+    def test_dropdown_reopens_without_allocating(self):
+        gui.Dropdown(self.window, dimensions=(160, 40), coordinates=(10, 10))
+        for _ in range(2):
+            click(self.window, (150, 20))
+            self.window.draw_block()
+            click(self.window, (150, 20))
+            self.window.draw_block()
+
+        misses = self.pool.misses
+        for _ in range(3):
+            click(self.window, (150, 20))
+            self.window.draw_block()
+            click(self.window, (150, 20))
+            self.window.draw_block()
+        self.assertEqual(self.pool.misses, misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
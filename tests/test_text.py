@@ -0,0 +1,112 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components.font_registry import FontRegistry
+from pygame_gui.components.text_cache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.font = pygame.font.Font(None, 20)
+        self.cache = TextCache(max_size=2)
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_hit_returns_same_surface(self):
+        surface = self.cache.render(self.font, 'a', (0, 0, 0))
+        self.assertIs(self.cache.render(self.font, 'a', (0, 0, 0)), surface)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_colour_is_part_of_key(self):
+        surface = self.cache.render(self.font, 'a', (0, 0, 0))
+        self.assertIsNot(self.cache.render(self.font, 'a', (255, 0, 0)), surface)
+
+    def test_least_recently_used_is_evicted(self):
+        a = self.cache.render(self.font, 'a', (0, 0, 0))
+        self.cache.render(self.font, 'b', (0, 0, 0))
+        self.cache.render(self.font, 'a', (0, 0, 0))
+        self.cache.render(self.font, 'c', (0, 0, 0))
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIs(self.cache.render(self.font, 'a', (0, 0, 0)), a)
+        self.cache.render(self.font, 'b', (0, 0, 0))
+        self.assertEqual(self.cache.misses, 4)
+
+    def test_shrinking_evicts(self):
+        self.cache.render(self.font, 'a', (0, 0, 0))
+        self.cache.render(self.font, 'b', (0, 0, 0))
+        self.cache.max_size = 1
+        self.assertEqual(len(self.cache), 1)
+
+
+class TestFontRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.registry = FontRegistry()
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_fonts_are_shared(self):
+        font = self.registry.get(None, 20)
+        self.assertIs(self.registry.get(None, 20), font)
+        self.assertIsNot(self.registry.get(None, 21), font)
+        self.assertIsNot(self.registry.get(None, 20, bold=True), font)
+        self.assertEqual(self.registry.stats(), {'fonts': 3, 'hits': 1, 'misses': 3})
+
+    def test_cleared_on_quit(self):
+        font = self.registry.get(None, 20)
+        pygame.quit()
+        self.assertEqual(len(self.registry), 0)
+
+        pygame.init()
+        self.assertIsNot(self.registry.get(None, 20), font)
+
+    def test_text_blocks_share_font(self):
+        window = gui.Window(dimensions=(200, 200))
+        a = gui.Text(window, dimensions=(100, 20), coordinates=(0, 0))
+        b = gui.Button(window, dimensions=(100, 20), coordinates=(0, 20))
+        self.assertIs(a.font, b.font)
+
+
+class TestText(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+        self.text = gui.Text(self.window, dimensions=(100, 20), coordinates=(0, 0), text_value='a')
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_unchanged_text_is_not_rerendered(self):
+        self.text.update_text()
+        surface = self.text.text_info['surface']
+        self.text.update_text()
+        self.assertIs(self.text.text_info['surface'], surface)
+
+    def test_changes_rerender(self):
+        self.text.update_text()
+        surface = self.text.text_info['surface']
+
+        self.text.set_text('b')
+        self.text.update_text()
+        self.assertIsNot(self.text.text_info['surface'], surface)
+
+        self.text.font_colour = 'white'
+        self.text.update_text()
+        self.assertEqual(self.text.text_info['key'], ('b', (255, 255, 255), gui.Alignment.CENTRE))
+
+        self.text.text_alignment = 'left'
+        self.text.update_text()
+        self.assertEqual(self.text.text_info['rect'].left, gui.constants.MARGIN)
+
+
+if __name__ == '__main__':
+    unittest.main()
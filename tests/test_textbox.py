@@ -0,0 +1,208 @@
+import os
+import random
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components.gap_buffer import GapBuffer
+
+
+def key_down(key=0, unicode='', mod=0):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=mod)
+
+
+class TestGapBuffer(unittest.TestCase):
+    def test_edits_match_string_slicing(self):
+        rng = random.Random(0)
+        buffer = GapBuffer('hello', gap_size=2)
+        expected = 'hello'
+
+        for _ in range(500):
+            pos = rng.randint(0, len(expected))
+            if rng.random() < 0.6:
+                text = rng.choice(['a', 'bc', 'defgh'])
+                buffer.insert(pos, text)
+                expected = expected[:pos] + text + expected[pos:]
+            else:
+                length = rng.randint(1, 3)
+                buffer.delete(pos, length)
+                expected = expected[:pos] + expected[pos + length:]
+
+            self.assertEqual(len(buffer), len(expected))
+        self.assertEqual(str(buffer), expected)
+        self.assertEqual([buffer[i] for i in range(len(buffer))], list(expected))
+
+    def test_dirty_range(self):
+        buffer = GapBuffer('abcdef')
+        self.assertEqual(buffer.take_dirty(), (0, 6))
+        self.assertIsNone(buffer.take_dirty())
+
+        buffer.insert(4, 'x')
+        buffer.delete(2)
+        self.assertEqual(buffer.take_dirty(), (2, 6))
+
+        buffer.delete(6)
+        self.assertIsNone(buffer.take_dirty())
+
+    def test_out_of_range(self):
+        buffer = GapBuffer('abc')
+        with self.assertRaises(IndexError):
+            buffer.insert(4, 'x')
+        with self.assertRaises(IndexError):
+            buffer[3]
+
+
+class TestTextBoxEditing(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(300, 100))
+        self.textbox = gui.TextBox(self.window, dimensions=(200, 40), coordinates=(0, 0), text_value='abc', active=True)
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_typing_and_deleting(self):
+        self.window.keyboard_event_handler(key_down(pygame.K_LEFT))
+        self.window.keyboard_event_handler(key_down(unicode='x'))
+        self.assertEqual(self.textbox.get_text(), 'abxc')
+
+        self.window.keyboard_event_handler(key_down(pygame.K_BACKSPACE, '\x08'))
+        self.window.keyboard_event_handler(key_down(pygame.K_BACKSPACE, '\x08'))
+        self.window.keyboard_event_handler(key_down(pygame.K_DELETE, '\x7f'))
+        self.assertEqual(self.textbox.get_text(), 'a')
+        self.assertEqual(self.textbox.cursor_info['location'], 1)
+
+    def test_set_text(self):
+        self.textbox.set_text('hello')
+        self.window.keyboard_event_handler(key_down(unicode='!'))
+        self.window.draw_block()
+        self.assertEqual(self.textbox.text_info['value'], 'hello!')
+
+    def test_keystrokes_render_once_per_frame(self):
+        self.window.draw_block()
+        renders = self.textbox.text_cache.misses
+        for character in 'many keys in one frame':
+            self.window.keyboard_event_handler(key_down(unicode=character))
+        self.assertEqual(self.textbox.text_cache.misses, renders)
+
+        self.window.draw_block()
+        self.assertEqual(self.textbox.text_cache.misses, renders + 1)
+        self.assertEqual(self.textbox.text_info['value'], 'abcmany keys in one frame')
+
+
+class TestTextBoxCursor(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(300, 100))
+        self.textbox = gui.TextBox(self.window, dimensions=(200, 40), coordinates=(10, 10), text_value='Wide mill')
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    @staticmethod
+    def _prefix_sizes(font, text):
+        return [font.size(text[:i])[0] for i in range(len(text) + 1)]
+
+    def test_prefix_widths_match_font(self):
+        self.textbox.update_text()
+        font = self.textbox.font
+        text = self.textbox.get_text()
+        self.assertEqual(self.textbox.prefix_widths, self._prefix_sizes(font, text))
+
+    def test_prefix_widths_follow_edits(self):
+        self.textbox.place_cursor(4)
+        self.textbox.insert_text('st')
+        self.textbox._handle_delete_input('\x7f')
+        self.textbox.update_text()
+
+        font = self.textbox.font
+        text = self.textbox.get_text()
+        self.assertEqual(text, 'Widestmill')
+        self.assertEqual(self.textbox.prefix_widths, self._prefix_sizes(font, text))
+
+    def test_cursor_follows_text(self):
+        self.textbox.place_cursor(4)
+        self.textbox.update_text()
+        text_rect = self.textbox.text_info['rect']
+        self.assertEqual(self.textbox.cursor_info['rect'].centerx, text_rect.left + self.textbox.prefix_widths[4])
+
+    def test_click_places_cursor(self):
+        self.textbox.update_text()
+        left = 10 + self.textbox.text_info['rect'].left
+        width = self.textbox.prefix_widths[4]
+
+        self.window.mouse_event_handler(pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, pos=(left + width + 1, 30), button=pygame.BUTTON_LEFT))
+        self.assertTrue(self.textbox.active)
+        self.assertEqual(self.textbox.cursor_info['location'], 4)
+
+        self.assertEqual(self.textbox.cursor_location_at(0), 0)
+        self.assertEqual(self.textbox.cursor_location_at(199), 9)
+
+    def test_cursor_stays_in_view(self):
+        self.window.focus.set_focus(self.textbox)
+        self.textbox.set_text('x' * 100)
+        self.textbox.update_text()
+        self.assertLessEqual(self.textbox.cursor_info['rect'].right, 200)
+
+        self.textbox.place_cursor(0)
+        self.textbox.update_text()
+        self.assertGreaterEqual(self.textbox.cursor_info['rect'].left, 0)
+
+    def test_cursor_at_end_of_long_text(self):
+        self.window.focus.set_focus(self.textbox)
+        self.textbox.set_text('x' * 500)
+        self.textbox.update_text()
+
+        # The end of the text as rendered, not just as measured, is in view next to the cursor
+        text_rect = self.textbox.text_info['rect']
+        self.assertEqual(self.textbox.prefix_widths[-1], self.textbox.text_info['surface'].get_width())
+        self.assertLessEqual(text_rect.right, 200)
+        self.assertGreater(text_rect.right, 150)
+        self.assertEqual(self.textbox.cursor_info['rect'].centerx, text_rect.right)
+
+
+class TestCursorBlink(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(300, 100))
+        self.textbox = gui.TextBox(self.window, dimensions=(200, 40), coordinates=(10, 10), text_value='abc')
+        self.textbox.cursor_tick_time = 0.01
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_focused_textbox_is_idle_between_blinks(self):
+        self.window.focus.set_focus(self.textbox)
+        self.window.draw_block()
+        self.assertTrue(self.window.is_idle())
+        self.assertLessEqual(self.window.time_until_next_timer(), 10)
+
+    def test_blink_damages_only_cursor(self):
+        self.window.focus.set_focus(self.textbox)
+        self.window.draw_block()
+
+        pygame.time.wait(15)
+        self.window.run_timers()
+        self.assertFalse(self.textbox.cursor_info['on'])
+
+        cursor_rect = self.textbox.cursor_info['rect'].move(self.textbox.coordinates)
+        self.assertEqual(self.window.draw_block(), [cursor_rect])
+
+    def test_cursor_surface_is_shared(self):
+        other = gui.TextBox(self.window, dimensions=(200, 40), coordinates=(10, 50))
+        self.textbox.update_text()
+        other.update_text()
+        self.assertIs(self.textbox.cursor_info['surface'], other.cursor_info['surface'])
+
+    def test_blur_stops_blinking(self):
+        self.window.focus.set_focus(self.textbox)
+        self.window.focus.clear_focus()
+        self.assertIsNone(self.window.time_until_next_timer())
+
+
+if __name__ == '__main__':
+    unittest.main()
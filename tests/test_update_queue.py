@@ -0,0 +1,97 @@
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+from pygame_gui.components.update_queue import UpdateQueue
+from pygame_gui.gui_base import GUIBase
+
+
+class TestUpdateQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+        self.text = gui.Text(self.window, dimensions=(50, 20), coordinates=(0, 0))
+        self.queue = UpdateQueue()
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_updates_are_coalesced(self):
+        for i in range(10000):
+            self.queue.call(self.text, 'set_text', str(i))
+            self.queue.set(self.text, 'colour', (i % 256, 0, 0))
+        self.queue.call(self.text, 'move', x=10, y=20)
+
+        self.assertEqual(len(self.queue), 3)
+        self.assertEqual(self.queue.drain(), 3)
+        self.assertEqual(self.text.get_text(), '9999')
+        self.assertEqual(self.text.colour, (9999 % 256, 0, 0))
+        self.assertEqual(self.text.coordinates, (10, 20))
+        self.assertEqual((self.queue.posted, self.queue.applied), (20001, 3))
+        self.assertEqual(self.queue.drain(), 0)
+
+    def test_applied_in_first_posted_order(self):
+        calls = []
+        self.queue.post('a', calls.append, 'a1')
+        self.queue.post('b', calls.append, 'b')
+        self.queue.post('a', calls.append, 'a2')
+        self.queue.drain()
+        self.assertEqual(calls, ['a2', 'b'])
+
+    def test_deleted_blocks_are_skipped(self):
+        self.queue.call(self.text, 'set_text', 'late')
+        self.text.__delitem__()
+        self.assertEqual(self.queue.drain(), 0)
+        self.assertEqual(self.text.get_text(), '')
+
+    def test_concurrent_posts(self):
+        texts = [gui.Text(self.window, dimensions=(50, 20), coordinates=(0, 0)) for _ in range(4)]
+
+        def feed(text):
+            for i in range(5000):
+                self.queue.call(text, 'set_text', str(i))
+
+        threads = [threading.Thread(target=feed, args=(text,)) for text in texts]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            self.queue.drain()
+        self.queue.drain()
+
+        self.assertEqual([text.get_text() for text in texts], ['4999'] * 4)
+        self.assertEqual(self.queue.posted, 20000)
+
+
+class TestGUIUpdates(unittest.TestCase):
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_posting_wakes_idle_gui(self):
+        gui_inst = GUIBase(dimensions=(200, 200))
+        text = gui.Text(gui_inst.window, dimensions=(50, 20), coordinates=(0, 0))
+        # Only there to stop the test hanging if the GUI isn't woken
+        gui_inst.window.set_timer(gui_inst.quit_gui, 2000, repeat=False)
+
+        def worker():
+            time.sleep(0.1)
+            gui_inst.window.updates.call(text, 'set_text', 'from worker')
+            gui_inst.window.updates.post('quit', gui_inst.quit_gui)
+
+        thread = threading.Thread(target=worker)
+        start = time.perf_counter()
+        thread.start()
+        gui_inst.run()
+        thread.join()
+
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(text.get_text(), 'from worker')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import pygame_gui.components as gui
+
+
+class TestChildren(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.window = gui.Window(dimensions=(200, 200))
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def _block(self, priority=0):
+        return gui.Block(self.window, dimensions=(10, 10), coordinates=(0, 0), priority=priority)
+
+    def test_priority_then_insertion_order(self):
+        a = self._block(1)
+        b = self._block(0)
+        c = self._block(1)
+        d = self._block(-1)
+        self.assertEqual(list(self.window.children), [d, b, a, c])
+
+    def test_priority_change_keeps_insertion_order(self):
+        a = self._block(0)
+        b = self._block(1)
+        c = self._block(0)
+
+        a.priority = 2
+        self.assertEqual(list(self.window.children), [c, b, a])
+
+        a.priority = 0
+        self.assertEqual(list(self.window.children), [a, c, b])
+
+    def test_remove(self):
+        a = self._block()
+        b = self._block()
+        a.__delitem__()
+
+        self.assertNotIn(a, self.window.children)
+        self.assertIn(b, self.window.children)
+        self.assertEqual(len(self.window.children), 1)
+
+    def test_draw_order(self):
+        bottom = gui.Block(self.window, dimensions=(10, 10), coordinates=(0, 0), colour=(1, 1, 1), priority=1)
+        gui.Block(self.window, dimensions=(10, 10), coordinates=(0, 0), colour=(2, 2, 2))
+        self.window.draw_block()
+        self.assertEqual(self.window.surface.get_at((5, 5))[:3], (1, 1, 1))
+
+        bottom.priority = -1
+        self.window.draw_block()
+        self.assertEqual(self.window.surface.get_at((5, 5))[:3], (2, 2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()